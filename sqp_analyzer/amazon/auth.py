@@ -1,5 +1,6 @@
 """SP-API authentication using Login with Amazon (LWA)."""
 
+import threading
 import time
 from dataclasses import dataclass
 from typing import Any
@@ -29,12 +30,21 @@ class SPAPIAuth:
     def __init__(self, config: SPAPIConfig):
         self.config = config
         self._access_token: AccessToken | None = None
+        self._refresh_lock = threading.Lock()
 
     def get_access_token(self) -> str:
-        """Get valid access token, refreshing if necessary."""
-        if self._access_token is None or self._access_token.is_expired():
-            self._refresh_token()
-        return self._access_token.token
+        """Get valid access token, refreshing if necessary.
+
+        Safe to call from several threads; only one of them refreshes.
+        """
+        token = self._access_token
+        if token is None or token.is_expired():
+            with self._refresh_lock:
+                token = self._access_token
+                if token is None or token.is_expired():
+                    self._refresh_token()
+                    token = self._access_token
+        return token.token
 
     def _refresh_token(self) -> None:
         """Refresh the access token using the refresh token."""
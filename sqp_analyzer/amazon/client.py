@@ -2,8 +2,11 @@
 
 import hashlib
 import hmac
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
+from functools import partial
 from typing import Any
 from urllib.parse import urlencode
 
@@ -18,6 +21,12 @@ from .models import APIResponse, SearchQueryMetrics, SQPReport
 SP_API_BASE_URL = "https://sellingpartnerapi-na.amazon.com"
 SQP_ENDPOINT = "/analytics/brandAnalytics/v1/searchQueryPerformance"
 
+# Minimum spacing between SP-API request starts (1 request per second)
+REQUEST_INTERVAL = 1.0
+
+# Maximum number of weekly reports fetched concurrently
+MAX_WEEKLY_WORKERS = 8
+
 
 class BrandAnalyticsClient:
     """Client for Amazon Brand Analytics API."""
@@ -26,6 +35,21 @@ class BrandAnalyticsClient:
         self.config = config
         self.auth = SPAPIAuth(config)
         self._session = requests.Session()
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+
+    def _wait_for_rate_limit(self) -> None:
+        """Block until this thread may start a request.
+
+        Request starts are spaced REQUEST_INTERVAL apart across all threads,
+        while the requests themselves can still overlap.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            if self._next_request_at > now:
+                time.sleep(self._next_request_at - now)
+                now = self._next_request_at
+            self._next_request_at = now + REQUEST_INTERVAL
 
     def _sign_request(
         self,
@@ -116,6 +140,7 @@ class BrandAnalyticsClient:
         # Sign request
         headers = self._sign_request(method, url, headers, params)
 
+        self._wait_for_rate_limit()
         try:
             response = self._session.request(
                 method=method,
@@ -237,24 +262,32 @@ class BrandAnalyticsClient:
             weeks: Number of weeks to fetch (default 12)
 
         Returns:
-            List of APIResponses, one per week
+            List of APIResponses, one per week (most recent first)
         """
-        reports = []
-        today = date.today()
+        if weeks <= 0:
+            return []
+
+        # Weeks are independent requests; fetch them concurrently while the
+        # shared rate limiter keeps request starts 1 second apart
+        with ThreadPoolExecutor(max_workers=min(weeks, MAX_WEEKLY_WORKERS)) as executor:
+            return list(executor.map(partial(self.fetch_single_week, asin), range(weeks)))
 
-        for week_offset in range(weeks):
-            # Calculate week boundaries (Monday to Sunday)
-            end_date = today - timedelta(days=today.weekday() + 1 + (week_offset * 7))
-            start_date = end_date - timedelta(days=6)
+    def fetch_single_week(self, asin: str, week_offset: int) -> APIResponse:
+        """Fetch the SQP report for one week.
 
-            # Rate limiting - 1 request per second
-            if week_offset > 0:
-                time.sleep(1)
+        Args:
+            asin: Parent ASIN
+            week_offset: Weeks back from the last complete week (0 = latest)
 
-            report = self.get_sqp_report(asin, start_date, end_date)
-            reports.append(report)
+        Returns:
+            APIResponse containing SQPReport on success
+        """
+        # Calculate week boundaries (Monday to Sunday)
+        today = date.today()
+        end_date = today - timedelta(days=today.weekday() + 1 + (week_offset * 7))
+        start_date = end_date - timedelta(days=6)
 
-        return reports
+        return self.get_sqp_report(asin, start_date, end_date)
 
     def test_connection(self) -> dict[str, Any]:
         """Test SP-API connection.
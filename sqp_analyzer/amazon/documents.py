@@ -0,0 +1,249 @@
+"""Download helpers for SP-API report documents."""
+
+import gzip
+import json
+import os
+import stat
+import tempfile
+import time
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import deflate
+except ImportError:
+    deflate = None
+
+
+# Size of the raw chunks read from the response while streaming
+_CHUNK_SIZE = 64 * 1024
+
+# Downloaded documents are cached by document ID in a private per-user
+# directory; a document's contents never change, so re-checking a finished
+# report reads it from disk. Entries older than _CACHE_MAX_AGE are evicted.
+_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "sqp_analyzer"
+    / "report_documents"
+)
+_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # seconds
+
+
+def _loads(data: bytes | bytearray) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=1)
+def get_session() -> requests.Session:
+    """Get the shared session for report document downloads.
+
+    Created once per process so repeated downloads and polls reuse pooled
+    keep-alive connections. Transient S3 errors are retried with backoff.
+    """
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+    )
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry),
+    )
+    return session
+
+
+def download_report_document(
+    url: str,
+    compression_algorithm: str | None = None,
+    session: requests.Session | None = None,
+) -> dict[str, Any]:
+    """Download and parse a report document from its pre-signed URL.
+
+    The body is decompressed as it streams in, so the compressed payload
+    and the decompressed text are never both held in memory. When the
+    libdeflate binding (``deflate``) is installed, gzip documents are instead
+    read whole and decompressed in one much faster libdeflate call.
+
+    Args:
+        url: Pre-signed document URL from get_report_document
+        compression_algorithm: "GZIP" if the document is gzip-compressed
+        session: Session to download with (defaults to a shared pooled session)
+
+    Returns:
+        Parsed report JSON
+    """
+    return _loads(_download(url, compression_algorithm, session))
+
+
+def _download(
+    url: str,
+    compression_algorithm: str | None,
+    session: requests.Session | None,
+) -> bytes | bytearray:
+    """Download a report document and return its decompressed bytes."""
+    session = session or get_session()
+    with session.get(url, stream=True, timeout=(5, 60)) as response:
+        response.raise_for_status()
+
+        if compression_algorithm == "GZIP" and deflate is not None:
+            return deflate.gzip_decompress(response.raw.read())
+
+        if compression_algorithm == "GZIP":
+            # wbits=31 makes zlib parse the gzip header and trailer itself
+            decompressor = zlib.decompressobj(wbits=31)
+            data = bytearray()
+            for chunk in response.raw.stream(_CHUNK_SIZE, decode_content=False):
+                data += decompressor.decompress(chunk)
+            data += decompressor.flush()
+            return data
+
+        response.raw.decode_content = True
+        return response.raw.read()
+
+
+def _cache_path(document_id: str) -> Path | None:
+    """Get a document's cache file path, or None if caching is unavailable.
+
+    The cache directory is created private (0700) and is only used while it
+    belongs to the current user and no one else can write to it.
+    """
+    if not document_id or Path(document_id).name != document_id:
+        return None
+    try:
+        _CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = _CACHE_DIR.lstat()
+    except OSError:
+        return None
+    if not stat.S_ISDIR(st.st_mode) or st.st_mode & 0o022:
+        return None
+    if hasattr(os, "getuid") and st.st_uid != os.getuid():
+        return None
+    return _CACHE_DIR / f"{document_id}.json.gz"
+
+
+def _read_cache(path: Path) -> bytes | None:
+    """Read a cached document, or None if it is missing, stale or unusable.
+
+    Symlinks and files owned by another user are never read.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    except OSError:
+        return None
+    with os.fdopen(fd, "rb") as raw:
+        st = os.fstat(fd)
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        if hasattr(os, "getuid") and st.st_uid != os.getuid():
+            return None
+        if time.time() - st.st_mtime > _CACHE_MAX_AGE:
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            with gzip.GzipFile(fileobj=raw, mode="rb") as f:
+                return f.read()
+        except (OSError, EOFError):
+            return None
+
+
+def _write_cache(path: Path, data: bytes | bytearray) -> None:
+    """Write gzip-compressed data to the cache, replacing the file atomically.
+
+    Also evicts entries older than _CACHE_MAX_AGE.
+    """
+    tmp_path = None
+    try:
+        # mkstemp creates a new 0600 file and never follows an existing link
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        tmp_path = Path(tmp_name)
+        with os.fdopen(fd, "wb") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=1) as f:
+                f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        # Caching is best effort; the download itself succeeded
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+        return
+    _evict_expired(path.parent)
+
+
+def _evict_expired(cache_dir: Path) -> None:
+    """Delete cache entries (and stray temp files) past _CACHE_MAX_AGE."""
+    cutoff = time.time() - _CACHE_MAX_AGE
+    try:
+        entries = list(os.scandir(cache_dir))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                os.unlink(entry.path)
+        except OSError:
+            pass
+
+
+def fetch_report_document(report: Any, document_id: str) -> dict[str, Any]:
+    """Look up a report document by ID and download its parsed contents.
+
+    Documents are cached on disk by ID, so later calls for the same document
+    skip both the document lookup and the download.
+
+    Args:
+        report: sp_api Reports client
+        document_id: reportDocumentId from get_report
+
+    Returns:
+        Parsed report JSON
+    """
+    cache_path = _cache_path(document_id)
+    if cache_path is not None:
+        cached = _read_cache(cache_path)
+        if cached is not None:
+            try:
+                return _loads(cached)
+            except ValueError:
+                pass  # Corrupt cache file; download again
+
+    doc_res = report.get_report_document(reportDocumentId=document_id, download=False)
+    data = _download(
+        doc_res.payload.get("url"),
+        doc_res.payload.get("compressionAlgorithm"),
+        None,
+    )
+    if cache_path is not None:
+        _write_cache(cache_path, data)
+    return _loads(data)
+
+
+@lru_cache(maxsize=64)
+def fetch_error_details(report: Any, document_id: str) -> str | None:
+    """Get the errorDetails message from a failed report's document.
+
+    Memoized per document, so a FATAL report seen by list_reports and then
+    checked again in the same process is only fetched and parsed once.
+
+    Args:
+        report: sp_api Reports client
+        document_id: reportDocumentId of the FATAL report
+
+    Returns:
+        The error message, or None if the document has none
+    """
+    return fetch_report_document(report, document_id).get("errorDetails")
@@ -1,5 +1,7 @@
 """Keyword categorization using Bread & Butter / Opportunity / Leak framework."""
 
+from collections import Counter
+
 from ..config import Thresholds
 from ..models import (
     CategorizedKeyword,
@@ -9,6 +11,15 @@ from ..models import (
 )
 
 
+# Recommended action for each category outcome
+_ACTION_BREAD_BUTTER = "Protect: maintain ranking and defend against competitors"
+_ACTION_OPPORTUNITY = "Increase PPC bids to gain visibility; high conversion potential"
+_ACTION_LEAK_CLICKS = "Fix: improve main image, title, or pricing to boost clicks"
+_ACTION_LEAK_PURCHASES = (
+    "Fix: review listing content, A+ content, or price competitiveness"
+)
+
+
 class KeywordCategorizer:
     """Categorize keywords based on impression, click, and purchase share."""
 
@@ -29,11 +40,54 @@ class KeywordCategorizer:
         Returns:
             List of CategorizedKeyword objects
         """
-        categorized = []
+        # Hoist thresholds into locals; this loop inlines _categorize_record()
+        t = self.thresholds
+        bread_butter_min_purchase = t.bread_butter_min_purchase_share
+        opportunity_max_imp = t.opportunity_max_imp_share
+        opportunity_min_purchase = t.opportunity_min_purchase_share
+        leak_min_imp = t.leak_min_imp_share
+        leak_max_click = t.leak_max_click_share
+        leak_max_purchase = t.leak_max_purchase_share
 
+        categorized = []
         for record in snapshot.records:
-            keyword = self._categorize_record(record)
-            categorized.append(keyword)
+            imp_share = record.impressions_share
+            click_share = record.clicks_share
+            purchase_share = record.purchases_share
+
+            if purchase_share >= bread_butter_min_purchase:
+                category = KeywordCategory.BREAD_BUTTER
+                action = _ACTION_BREAD_BUTTER
+            elif (
+                imp_share < opportunity_max_imp
+                and purchase_share >= opportunity_min_purchase
+            ):
+                category = KeywordCategory.OPPORTUNITY
+                action = _ACTION_OPPORTUNITY
+            elif imp_share >= leak_min_imp and click_share < leak_max_click:
+                category = KeywordCategory.LEAK
+                action = _ACTION_LEAK_CLICKS
+            elif imp_share >= leak_min_imp and purchase_share < leak_max_purchase:
+                category = KeywordCategory.LEAK
+                action = _ACTION_LEAK_PURCHASES
+            else:
+                category = KeywordCategory.UNCATEGORIZED
+                action = ""
+
+            categorized.append(
+                CategorizedKeyword(
+                    search_query=record.search_query,
+                    asin=record.asin,
+                    category=category,
+                    action=action,
+                    impressions_share=imp_share,
+                    clicks_share=click_share,
+                    purchases_share=purchase_share,
+                    search_volume=record.search_volume,
+                    asin_price=record.asin_price,
+                    market_price=record.market_price,
+                )
+            )
 
         return categorized
 
@@ -45,7 +99,7 @@ class KeywordCategorizer:
         # Check Bread & Butter first (highest priority)
         if record.purchases_share >= self.thresholds.bread_butter_min_purchase_share:
             category = KeywordCategory.BREAD_BUTTER
-            action = "Protect: maintain ranking and defend against competitors"
+            action = _ACTION_BREAD_BUTTER
 
         # Check Opportunity
         elif (
@@ -53,7 +107,7 @@ class KeywordCategorizer:
             and record.purchases_share >= self.thresholds.opportunity_min_purchase_share
         ):
             category = KeywordCategory.OPPORTUNITY
-            action = "Increase PPC bids to gain visibility; high conversion potential"
+            action = _ACTION_OPPORTUNITY
 
         # Check Leak
         elif (
@@ -65,9 +119,9 @@ class KeywordCategorizer:
         ):
             category = KeywordCategory.LEAK
             if record.clicks_share < self.thresholds.leak_max_click_share:
-                action = "Fix: improve main image, title, or pricing to boost clicks"
+                action = _ACTION_LEAK_CLICKS
             else:
-                action = "Fix: review listing content, A+ content, or price competitiveness"
+                action = _ACTION_LEAK_PURCHASES
 
         return CategorizedKeyword(
             search_query=record.search_query,
@@ -100,14 +154,24 @@ class KeywordCategorizer:
         """Get all Leak keywords."""
         return [k for k in categorized if k.category == KeywordCategory.LEAK]
 
+    def group_by_category(
+        self, categorized: list[CategorizedKeyword]
+    ) -> dict[KeywordCategory, list[CategorizedKeyword]]:
+        """Split keywords into one list per category in a single pass."""
+        groups: dict[KeywordCategory, list[CategorizedKeyword]] = {
+            category: [] for category in KeywordCategory
+        }
+        for keyword in categorized:
+            groups[keyword.category].append(keyword)
+        return groups
+
     def summarize(self, categorized: list[CategorizedKeyword]) -> dict[str, int]:
         """Get counts by category."""
+        counts = Counter(k.category for k in categorized)
         return {
             "total": len(categorized),
-            "bread_butter": len(self.get_bread_butter(categorized)),
-            "opportunities": len(self.get_opportunities(categorized)),
-            "leaks": len(self.get_leaks(categorized)),
-            "uncategorized": len(
-                [k for k in categorized if k.category == KeywordCategory.UNCATEGORIZED]
-            ),
+            "bread_butter": counts[KeywordCategory.BREAD_BUTTER],
+            "opportunities": counts[KeywordCategory.OPPORTUNITY],
+            "leaks": counts[KeywordCategory.LEAK],
+            "uncategorized": counts[KeywordCategory.UNCATEGORIZED],
         }
@@ -1,5 +1,9 @@
 """Diagnostic analyzer for SQP keywords."""
 
+from bisect import bisect_right
+from collections import Counter
+from operator import attrgetter
+
 from ..config import Thresholds
 from ..models import (
     DiagnosticType,
@@ -11,6 +15,41 @@ from ..models import (
 )
 
 
+# Actionable fix recommendation for each diagnostic type
+_FIX_RECOMMENDATIONS: dict[DiagnosticType, str] = {
+    DiagnosticType.GHOST: (
+        "Not ranking for this keyword. Add to listing (title/bullets/backend) "
+        "or run PPC to build relevance."
+    ),
+    DiagnosticType.WINDOW_SHOPPER: (
+        "Customers see but don't click. Improve main image, title, "
+        "or review count. Check competitor positioning."
+    ),
+    DiagnosticType.PRICE_PROBLEM: (
+        "Price is above market. Consider price adjustment, bundle offers, "
+        "or highlight value proposition in listing."
+    ),
+    DiagnosticType.HEALTHY: "No issues detected. Maintain current strategy.",
+}
+
+# Rank status for each bucket of _rank_edges(), lowest impression share first
+_RANK_BY_BUCKET = (
+    RankStatus.INVISIBLE,
+    RankStatus.PAGE_1_LOW,
+    RankStatus.PAGE_1_HIGH,
+    RankStatus.TOP_3,
+)
+
+
+def _rank_edges(thresholds: Thresholds) -> tuple[float, float, float]:
+    """Rank thresholds in ascending order, for bisecting an impression share."""
+    return (
+        thresholds.rank_page_1_low_threshold,
+        thresholds.rank_page_1_high_threshold,
+        thresholds.rank_top_3_threshold,
+    )
+
+
 class DiagnosticAnalyzer:
     """Analyzes keywords for diagnostic issues and opportunities."""
 
@@ -19,14 +58,8 @@ class DiagnosticAnalyzer:
 
     def get_rank_status(self, impressions_share: float) -> RankStatus:
         """Estimate page position from impression share percentage."""
-        if impressions_share >= self.thresholds.rank_top_3_threshold:
-            return RankStatus.TOP_3
-        elif impressions_share >= self.thresholds.rank_page_1_high_threshold:
-            return RankStatus.PAGE_1_HIGH
-        elif impressions_share >= self.thresholds.rank_page_1_low_threshold:
-            return RankStatus.PAGE_1_LOW
-        else:
-            return RankStatus.INVISIBLE
+        edges = _rank_edges(self.thresholds)
+        return _RANK_BY_BUCKET[bisect_right(edges, impressions_share)]
 
     def calculate_opportunity_score(self, record: SQPRecord) -> float:
         """Calculate opportunity score: volume * (1 - imp_share/100).
@@ -73,22 +106,7 @@ class DiagnosticAnalyzer:
 
     def get_fix_recommendation(self, diagnostic: DiagnosticType) -> str:
         """Get actionable fix recommendation for a diagnostic type."""
-        recommendations = {
-            DiagnosticType.GHOST: (
-                "Not ranking for this keyword. Add to listing (title/bullets/backend) "
-                "or run PPC to build relevance."
-            ),
-            DiagnosticType.WINDOW_SHOPPER: (
-                "Customers see but don't click. Improve main image, title, "
-                "or review count. Check competitor positioning."
-            ),
-            DiagnosticType.PRICE_PROBLEM: (
-                "Price is above market. Consider price adjustment, bundle offers, "
-                "or highlight value proposition in listing."
-            ),
-            DiagnosticType.HEALTHY: "No issues detected. Maintain current strategy.",
-        }
-        return recommendations.get(diagnostic, "")
+        return _FIX_RECOMMENDATIONS.get(diagnostic, "")
 
     def analyze(
         self,
@@ -105,52 +123,76 @@ class DiagnosticAnalyzer:
             List of KeywordDiagnostic objects sorted by opportunity score (descending)
         """
         # Build set of keywords with price flags for fast lookup
-        price_flagged_queries = set()
-        if price_flags:
-            price_flagged_queries = {pf.search_query for pf in price_flags}
+        price_flagged_queries = frozenset(
+            pf.search_query for pf in price_flags or ()
+        )
+
+        # Hoist thresholds into locals; this loop inlines diagnose(),
+        # get_rank_status() and calculate_opportunity_score() so each keyword
+        # is scored and classified in a single pass
+        t = self.thresholds
+        ghost_min_volume = t.ghost_min_volume
+        ghost_max_imp_share = t.ghost_max_imp_share
+        window_min_imp_share = t.window_shopper_min_imp_share
+        window_max_click_share = t.window_shopper_max_click_share
+        price_min_imp_share = t.price_problem_min_imp_share
+        min_issue_imp_share = min(window_min_imp_share, price_min_imp_share)
+        rank_edges = _rank_edges(t)
 
         diagnostics = []
         for record in snapshot.records:
-            has_price_flag = record.search_query in price_flagged_queries
-            diagnostic_type = self.diagnose(record, has_price_flag)
-            rank_status = self.get_rank_status(record.impressions_share)
-            opportunity_score = self.calculate_opportunity_score(record)
+            volume = record.search_volume
+            imp_share = record.impressions_share
+            click_share = record.clicks_share
+
+            # Most keywords sit below both the window-shopper and price-problem
+            # impression floors, where only GHOST or HEALTHY is possible, so
+            # settle those first and skip the remaining checks
+            if imp_share < min_issue_imp_share:
+                if volume >= ghost_min_volume and imp_share < ghost_max_imp_share:
+                    diagnostic_type = DiagnosticType.GHOST
+                else:
+                    diagnostic_type = DiagnosticType.HEALTHY
+            elif volume >= ghost_min_volume and imp_share < ghost_max_imp_share:
+                diagnostic_type = DiagnosticType.GHOST
+            elif (
+                imp_share >= window_min_imp_share
+                and click_share < window_max_click_share
+            ):
+                diagnostic_type = DiagnosticType.WINDOW_SHOPPER
+            elif (
+                imp_share >= price_min_imp_share
+                and record.search_query in price_flagged_queries
+            ):
+                diagnostic_type = DiagnosticType.PRICE_PROBLEM
+            else:
+                diagnostic_type = DiagnosticType.HEALTHY
 
             diagnostics.append(
                 KeywordDiagnostic(
                     search_query=record.search_query,
                     asin=record.asin,
                     diagnostic_type=diagnostic_type,
-                    rank_status=rank_status,
-                    opportunity_score=opportunity_score,
-                    search_volume=record.search_volume,
-                    impressions_share=record.impressions_share,
-                    clicks_share=record.clicks_share,
+                    rank_status=_RANK_BY_BUCKET[bisect_right(rank_edges, imp_share)],
+                    opportunity_score=volume * (1 - imp_share / 100),
+                    search_volume=volume,
+                    impressions_share=imp_share,
+                    clicks_share=click_share,
                     purchases_share=record.purchases_share,
-                    recommended_fix=self.get_fix_recommendation(diagnostic_type),
+                    recommended_fix=_FIX_RECOMMENDATIONS[diagnostic_type],
                 )
             )
 
-        # Sort by opportunity score descending
-        diagnostics.sort(key=lambda d: d.opportunity_score, reverse=True)
+        diagnostics.sort(key=attrgetter("opportunity_score"), reverse=True)
         return diagnostics
 
     def summarize(self, diagnostics: list[KeywordDiagnostic]) -> dict[str, int]:
         """Summarize diagnostic counts."""
-        counts = {
+        counts = Counter(d.diagnostic_type for d in diagnostics)
+        return {
             "total": len(diagnostics),
-            "ghost": 0,
-            "window_shopper": 0,
-            "price_problem": 0,
-            "healthy": 0,
+            "ghost": counts[DiagnosticType.GHOST],
+            "window_shopper": counts[DiagnosticType.WINDOW_SHOPPER],
+            "price_problem": counts[DiagnosticType.PRICE_PROBLEM],
+            "healthy": counts[DiagnosticType.HEALTHY],
         }
-        for d in diagnostics:
-            if d.diagnostic_type == DiagnosticType.GHOST:
-                counts["ghost"] += 1
-            elif d.diagnostic_type == DiagnosticType.WINDOW_SHOPPER:
-                counts["window_shopper"] += 1
-            elif d.diagnostic_type == DiagnosticType.PRICE_PROBLEM:
-                counts["price_problem"] += 1
-            else:
-                counts["healthy"] += 1
-        return counts
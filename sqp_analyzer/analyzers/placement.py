@@ -1,5 +1,10 @@
 """Placement recommender for SQP keywords."""
 
+from bisect import bisect_right
+from collections import Counter
+from itertools import chain
+from operator import attrgetter
+
 from ..config import Thresholds
 from ..models import (
     KeywordPlacement,
@@ -9,23 +14,30 @@ from ..models import (
 )
 
 
+# Output order of placement targets, most prominent listing location first
+_PLACEMENT_ORDER = (
+    PlacementTarget.TITLE,
+    PlacementTarget.BULLETS,
+    PlacementTarget.BACKEND,
+    PlacementTarget.DESCRIPTION,
+)
+
+
 class PlacementRecommender:
     """Recommends keyword placement locations based on volume and performance."""
 
     def __init__(self, thresholds: Thresholds):
         self.thresholds = thresholds
 
-    def _calculate_percentile(self, value: int, all_values: list[int]) -> float:
-        """Calculate percentile of a value within a list.
+    def _calculate_percentile(self, value: int, sorted_values: list[int]) -> float:
+        """Calculate percentile of a value within an ascending sorted list.
 
         Returns the percentage of values that are less than or equal to the given value.
         """
-        if not all_values:
+        if not sorted_values:
             return 0.0
-        if len(all_values) == 1:
-            return 100.0 if value >= all_values[0] else 0.0
-        count_below = sum(1 for v in all_values if v <= value)
-        return (count_below / len(all_values)) * 100
+        count_below = bisect_right(sorted_values, value)
+        return (count_below / len(sorted_values)) * 100
 
     def recommend_placement(
         self,
@@ -41,16 +53,18 @@ class PlacementRecommender:
         Returns:
             Tuple of (PlacementTarget, reasoning string)
         """
+        t = self.thresholds
+
         # TITLE: Top 5% volume OR (top 20% volume + good click share)
-        if volume_percentile >= self.thresholds.title_top_volume_percentile:
+        if volume_percentile >= t.title_top_volume_percentile:
             return (
                 PlacementTarget.TITLE,
                 f"Top {100 - volume_percentile:.0f}% volume - must be in title"
             )
 
         if (
-            volume_percentile >= self.thresholds.title_min_volume_percentile
-            and record.clicks_share >= self.thresholds.title_min_click_share
+            volume_percentile >= t.title_min_volume_percentile
+            and record.clicks_share >= t.title_min_click_share
         ):
             return (
                 PlacementTarget.TITLE,
@@ -59,7 +73,7 @@ class PlacementRecommender:
             )
 
         # BULLETS: 50-80% volume percentile
-        if volume_percentile >= self.thresholds.bullets_min_volume_percentile:
+        if volume_percentile >= t.bullets_min_volume_percentile:
             return (
                 PlacementTarget.BULLETS,
                 f"Mid-high volume ({volume_percentile:.0f}th percentile) - "
@@ -67,7 +81,7 @@ class PlacementRecommender:
             )
 
         # BACKEND: 20-50% volume percentile
-        if volume_percentile >= self.thresholds.backend_min_volume_percentile:
+        if volume_percentile >= t.backend_min_volume_percentile:
             return (
                 PlacementTarget.BACKEND,
                 f"Moderate volume ({volume_percentile:.0f}th percentile) - "
@@ -93,15 +107,24 @@ class PlacementRecommender:
         if not snapshot.records:
             return []
 
-        # Calculate volume percentiles
-        volumes = [r.search_volume for r in snapshot.records]
+        # Percentile of each distinct volume from one walk over the sorted
+        # volumes; later duplicates overwrite earlier ones, so each volume maps
+        # to its highest rank (the count of values <= it)
+        volumes = sorted(snapshot.column("search_volume"))
+        total = len(volumes)
+        percentiles = {v: (i / total) * 100 for i, v in enumerate(volumes, 1)}
 
-        placements = []
+        # Bucket placements by target as they are built, in _PLACEMENT_ORDER
+        buckets: dict[PlacementTarget, list[KeywordPlacement]] = {
+            target: [] for target in _PLACEMENT_ORDER
+        }
+        recommend = self.recommend_placement
         for record in snapshot.records:
-            volume_percentile = self._calculate_percentile(record.search_volume, volumes)
-            placement, reasoning = self.recommend_placement(record, volume_percentile)
+            placement, reasoning = recommend(
+                record, percentiles[record.search_volume]
+            )
 
-            placements.append(
+            buckets[placement].append(
                 KeywordPlacement(
                     search_query=record.search_query,
                     asin=record.asin,
@@ -114,39 +137,22 @@ class PlacementRecommender:
             )
 
         # Assign priorities within each placement category (1 = highest volume)
-        for target in PlacementTarget:
-            category_placements = [p for p in placements if p.placement == target]
-            category_placements.sort(key=lambda p: p.search_volume, reverse=True)
-            for i, p in enumerate(category_placements, 1):
+        by_volume = attrgetter("search_volume")
+        for bucket in buckets.values():
+            bucket.sort(key=by_volume, reverse=True)
+            for i, p in enumerate(bucket, 1):
                 p.priority = i
 
-        # Sort by placement priority (TITLE first) then by priority number
-        placement_order = {
-            PlacementTarget.TITLE: 0,
-            PlacementTarget.BULLETS: 1,
-            PlacementTarget.BACKEND: 2,
-            PlacementTarget.DESCRIPTION: 3,
-        }
-        placements.sort(key=lambda p: (placement_order[p.placement], p.priority))
-
-        return placements
+        # Buckets are already in placement order and sorted by priority
+        return list(chain.from_iterable(buckets.values()))
 
     def summarize(self, placements: list[KeywordPlacement]) -> dict[str, int]:
         """Summarize placement counts."""
-        counts = {
+        counts = Counter(p.placement for p in placements)
+        return {
             "total": len(placements),
-            "title": 0,
-            "bullets": 0,
-            "backend": 0,
-            "description": 0,
+            "title": counts[PlacementTarget.TITLE],
+            "bullets": counts[PlacementTarget.BULLETS],
+            "backend": counts[PlacementTarget.BACKEND],
+            "description": counts[PlacementTarget.DESCRIPTION],
         }
-        for p in placements:
-            if p.placement == PlacementTarget.TITLE:
-                counts["title"] += 1
-            elif p.placement == PlacementTarget.BULLETS:
-                counts["bullets"] += 1
-            elif p.placement == PlacementTarget.BACKEND:
-                counts["backend"] += 1
-            else:
-                counts["description"] += 1
-        return counts
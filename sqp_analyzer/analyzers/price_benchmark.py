@@ -1,5 +1,7 @@
 """Price benchmarking and competitiveness analysis."""
 
+from operator import attrgetter
+
 from ..config import Thresholds
 from ..models import PriceFlag, PriceSeverity, SQPRecord, WeeklySnapshot
 
@@ -22,22 +24,24 @@ class PriceBenchmark:
         Returns:
             List of PriceFlag objects (only flagged keywords)
         """
-        flags = []
+        critical = []
+        warnings = []
 
         for record in snapshot.records:
             flag = self._analyze_record(record)
-            if flag is not None:
-                flags.append(flag)
-
-        # Sort by severity (critical first) then by price diff
-        flags.sort(
-            key=lambda f: (
-                0 if f.severity == PriceSeverity.CRITICAL else 1,
-                -f.price_diff_percent,
-            )
-        )
-
-        return flags
+            if flag is None:
+                continue
+            if flag.severity == PriceSeverity.CRITICAL:
+                critical.append(flag)
+            else:
+                warnings.append(flag)
+
+        # Critical first, each group sorted by price diff (largest first)
+        by_price_diff = attrgetter("price_diff_percent")
+        critical.sort(key=by_price_diff, reverse=True)
+        warnings.sort(key=by_price_diff, reverse=True)
+
+        return critical + warnings
 
     def _analyze_record(self, record: SQPRecord) -> PriceFlag | None:
         """Analyze price competitiveness for a single record.
@@ -1,9 +1,10 @@
 """12-week trend tracking for keyword performance."""
 
 from datetime import date
+from operator import attrgetter
 from statistics import mean
 
-from ..models import SQPRecord, TrendDirection, TrendRecord, WeeklySnapshot
+from ..models import TrendDirection, TrendRecord, WeeklySnapshot
 
 
 class TrendTracker:
@@ -17,6 +18,46 @@ class TrendTracker:
         """
         self.growth_threshold = growth_threshold
 
+        # Running state for add_snapshot()/finalize(): purchase share per
+        # week for each query, and the ASIN of the first snapshot added
+        self._query_weeks: dict[str, dict[date, float]] = {}
+        self._asin: str | None = None
+
+    def add_snapshot(self, snapshot: WeeklySnapshot) -> None:
+        """Fold one weekly snapshot into the running trend data.
+
+        Only each keyword's purchase share is kept, so snapshots can be
+        streamed in and dropped as soon as they have been added.
+        """
+        if self._asin is None:
+            self._asin = snapshot.asin
+
+        week_date = snapshot.week_date
+        for record in snapshot.records:
+            weeks = self._query_weeks.setdefault(record.search_query, {})
+            weeks[week_date] = record.purchases_share
+
+    def finalize(self) -> list[TrendRecord]:
+        """Build trend records from all snapshots added so far.
+
+        Resets the running state, so the tracker can be reused.
+
+        Returns:
+            List of TrendRecord objects sorted by growth (descending)
+        """
+        query_weeks, asin = self._query_weeks, self._asin
+        self._query_weeks, self._asin = {}, None
+
+        trends = [
+            self._calculate_trend(query, weeks_data, asin)
+            for query, weeks_data in query_weeks.items()
+        ]
+
+        # Sort by growth percentage (descending)
+        trends.sort(key=attrgetter("growth_percent"), reverse=True)
+
+        return trends
+
     def analyze_trends(
         self, snapshots: list[WeeklySnapshot]
     ) -> list[TrendRecord]:
@@ -36,33 +77,16 @@ class TrendTracker:
         if not snapshots:
             return []
 
-        # Sort by date (oldest first for trend calculation)
-        sorted_snapshots = sorted(snapshots, key=lambda s: s.week_date)
-
-        # Group records by search query across all weeks
-        query_weeks: dict[str, dict[date, SQPRecord]] = {}
+        # Add oldest first for trend calculation
+        for snapshot in sorted(snapshots, key=attrgetter("week_date")):
+            self.add_snapshot(snapshot)
 
-        for snapshot in sorted_snapshots:
-            for record in snapshot.records:
-                if record.search_query not in query_weeks:
-                    query_weeks[record.search_query] = {}
-                query_weeks[record.search_query][snapshot.week_date] = record
-
-        # Build trend records
-        trends = []
-        for query, weeks_data in query_weeks.items():
-            trend = self._calculate_trend(query, weeks_data, sorted_snapshots[0].asin)
-            trends.append(trend)
-
-        # Sort by growth percentage (descending)
-        trends.sort(key=lambda t: t.growth_percent, reverse=True)
-
-        return trends
+        return self.finalize()
 
     def _calculate_trend(
         self,
         query: str,
-        weeks_data: dict[date, SQPRecord],
+        weeks_data: dict[date, float],
         asin: str,
     ) -> TrendRecord:
         """Calculate trend for a single search query."""
@@ -72,12 +96,11 @@ class TrendTracker:
         # Build weekly purchase share dict
         weekly_shares = {}
         for i, week_date in enumerate(sorted_weeks, 1):
-            record = weeks_data[week_date]
             week_label = f"Week {i}"
-            weekly_shares[week_label] = record.purchases_share
+            weekly_shares[week_label] = weeks_data[week_date]
 
         # Calculate trend direction and growth
-        shares = [weeks_data[w].purchases_share for w in sorted_weeks]
+        shares = [weeks_data[w] for w in sorted_weeks]
         direction, growth = self._analyze_direction(shares)
 
         return TrendRecord(
@@ -132,7 +155,7 @@ class TrendTracker:
         if len(snapshots) < 4:
             return {}
 
-        sorted_snapshots = sorted(snapshots, key=lambda s: s.week_date)
+        sorted_snapshots = sorted(snapshots, key=attrgetter("week_date"))
 
         # Define phases
         phases = {
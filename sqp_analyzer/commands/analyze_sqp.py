@@ -9,15 +9,15 @@ Usage:
 """
 
 import argparse
-import gzip
-import json
+import heapq
 import sys
 from datetime import date
+from operator import attrgetter
 
-import requests
 from sp_api.api import Reports
 from sp_api.base import Marketplaces
 
+from ..amazon.documents import fetch_report_document
 from ..analyzers.diagnostic import DiagnosticAnalyzer
 from ..analyzers.placement import PlacementRecommender
 from ..config import load_config
@@ -80,16 +80,7 @@ def fetch_report_data(credentials: dict, report_id: str) -> dict | None:
         return None
 
     # Download report
-    doc_res = report.get_report_document(reportDocumentId=doc_id, download=False)
-    url = doc_res.payload.get("url")
-
-    response = requests.get(url)
-    if doc_res.payload.get("compressionAlgorithm") == "GZIP":
-        data = gzip.decompress(response.content).decode("utf-8")
-    else:
-        data = response.text
-
-    return json.loads(data)
+    return fetch_report_document(report, doc_id)
 
 
 def parse_report_to_snapshot(report_data: dict) -> WeeklySnapshot | None:
@@ -215,25 +206,19 @@ def main() -> int:
     print("\nWriting to Google Sheets...")
     sheets = SheetsClient(config.sheets)
 
-    # Write diagnostics
-    diag_dicts = [d.to_dict() for d in diagnostics]
-    sheets.write_diagnostics(diag_dicts)
-    print(f"  Wrote {len(diag_dicts)} rows to SQP-Diagnostics")
-
-    # Write placements
-    place_dicts = [p.to_dict() for p in placements]
-    sheets.write_placements(place_dicts)
-    print(f"  Wrote {len(place_dicts)} rows to SQP-Placements")
-
-    # Write top opportunities (top 20 by opportunity score)
-    top_opportunities = sorted(
-        diagnostics,
-        key=lambda d: d.opportunity_score,
-        reverse=True,
-    )[:20]
-    opp_dicts = [d.to_dict() for d in top_opportunities]
-    sheets.write_opportunity_ranking(opp_dicts)
-    print(f"  Wrote {len(opp_dicts)} rows to SQP-TopOpportunities")
+    # Queue all three tabs and send them in one batched update
+    with sheets.batch() as writes:
+        sheets.write_diagnostics(diagnostics)
+        sheets.write_placements(placements)
+
+        # Write top opportunities (top 20 by opportunity score)
+        top_opportunities = heapq.nlargest(
+            20, diagnostics, key=attrgetter("opportunity_score")
+        )
+        sheets.write_opportunity_ranking(top_opportunities)
+
+    for tab_name, rows in writes:
+        print(f"  Wrote {len(rows) - 1} rows to {tab_name}")
 
     print("\n[SUCCESS] Analysis complete!")
     print(f"View results: https://docs.google.com/spreadsheets/d/{config.sheets.spreadsheet_id}")
@@ -6,17 +6,15 @@ Usage:
 """
 
 import argparse
-import gzip
-import json
 import sys
 from datetime import date
-
-import requests
-from sp_api.api import Reports
-from sp_api.base import Marketplaces
+from operator import itemgetter
 
 from ..config import load_config
-from ..sheets.client import SheetsClient
+
+
+# Shared read-only default for .get() on missing nested report objects
+_EMPTY: dict = {}
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -45,6 +43,12 @@ def get_credentials() -> dict:
 
 def fetch_report_data(credentials: dict, report_id: str) -> dict | None:
     """Fetch completed report data from SP-API."""
+    # Imported here so --help and argument errors skip the sp_api import
+    from sp_api.api import Reports
+    from sp_api.base import Marketplaces
+
+    from ..amazon.documents import fetch_report_document
+
     report = Reports(credentials=credentials, marketplace=Marketplaces.US)
 
     res = report.get_report(reportId=report_id)
@@ -59,36 +63,60 @@ def fetch_report_data(credentials: dict, report_id: str) -> dict | None:
         print(f"Report {report_id} has no document ID")
         return None
 
-    doc_res = report.get_report_document(reportDocumentId=doc_id, download=False)
-    url = doc_res.payload.get("url")
-
-    response = requests.get(url)
-    if doc_res.payload.get("compressionAlgorithm") == "GZIP":
-        data = gzip.decompress(response.content).decode("utf-8")
-    else:
-        data = response.text
-
-    return json.loads(data)
+    return fetch_report_document(report, doc_id)
+
+
+def _date_row(entry: dict) -> list:
+    """Build a Traffic-ByDate row from a salesAndTrafficByDate entry."""
+    sales = entry.get("salesByDate", _EMPTY)
+    traffic = entry.get("trafficByDate", _EMPTY)
+
+    return [
+        entry.get("date", ""),
+        sales.get("unitsOrdered", 0),
+        sales.get("orderedProductSales", _EMPTY).get("amount", 0),
+        sales.get("unitsShipped", 0),
+        sales.get("ordersShipped", 0),
+        traffic.get("sessions", 0),
+        traffic.get("pageViews", 0),
+        traffic.get("buyBoxPercentage", 0),
+        traffic.get("unitSessionPercentage", 0),
+        traffic.get("orderItemSessionPercentage", 0),
+    ]
+
+
+def _asin_row(entry: dict) -> list:
+    """Build a Traffic-ByASIN row from a salesAndTrafficByAsin entry."""
+    parent_asin = entry.get("parentAsin", "")
+    sales = entry.get("salesByAsin", _EMPTY)
+    traffic = entry.get("trafficByAsin", _EMPTY)
+
+    return [
+        entry.get("childAsin", "") or parent_asin,
+        parent_asin,
+        entry.get("sku", ""),
+        sales.get("unitsOrdered", 0),
+        sales.get("orderedProductSales", _EMPTY).get("amount", 0),
+        sales.get("unitsShipped", 0),
+        traffic.get("sessions", 0),
+        traffic.get("pageViews", 0),
+        traffic.get("buyBoxPercentage", 0),
+        traffic.get("unitSessionPercentage", 0),
+    ]
 
 
 def write_to_sheets(config, report_data: dict) -> None:
     """Write traffic and sales data to Google Sheets."""
+    from ..sheets.client import SheetsClient
+
     sheets = SheetsClient(config.sheets)
-    spreadsheet = sheets._get_spreadsheet()
 
-    # Get or create worksheets
-    def get_or_create_worksheet(name: str, rows: int = 1000, cols: int = 20):
-        try:
-            return spreadsheet.worksheet(name)
-        except Exception:
-            return spreadsheet.add_worksheet(title=name, rows=rows, cols=cols)
+    # (tab name, rows) for every tab to write, sent in one batch below
+    writes = []
 
-    # Write Sales by Date
+    # Sales by Date
     sales_by_date = report_data.get("salesAndTrafficByDate", [])
     if sales_by_date:
-        ws = get_or_create_worksheet("Traffic-ByDate")
-        ws.clear()
-
         headers = [
             "Date",
             "Units Ordered",
@@ -102,36 +130,12 @@ def write_to_sheets(config, report_data: dict) -> None:
             "Order Item Session %",
         ]
 
-        rows = [headers]
-        for entry in sales_by_date:
-            dt = entry.get("date", "")
-            sales = entry.get("salesByDate", {})
-            traffic = entry.get("trafficByDate", {})
-
-            ordered_sales = sales.get("orderedProductSales", {})
-
-            rows.append([
-                dt,
-                sales.get("unitsOrdered", 0),
-                ordered_sales.get("amount", 0),
-                sales.get("unitsShipped", 0),
-                sales.get("ordersShipped", 0),
-                traffic.get("sessions", 0),
-                traffic.get("pageViews", 0),
-                traffic.get("buyBoxPercentage", 0),
-                traffic.get("unitSessionPercentage", 0),
-                traffic.get("orderItemSessionPercentage", 0),
-            ])
-
-        ws.update("A1", rows)
-        print(f"  Wrote {len(sales_by_date)} rows to Traffic-ByDate")
-
-    # Write Sales by ASIN
+        rows = [headers, *map(_date_row, sales_by_date)]
+        writes.append(("Traffic-ByDate", rows))
+
+    # Sales by ASIN
     sales_by_asin = report_data.get("salesAndTrafficByAsin", [])
     if sales_by_asin:
-        ws = get_or_create_worksheet("Traffic-ByASIN")
-        ws.clear()
-
         headers = [
             "ASIN",
             "Parent ASIN",
@@ -145,37 +149,21 @@ def write_to_sheets(config, report_data: dict) -> None:
             "Unit Session %",
         ]
 
-        # Sort by units ordered
-        sales_by_asin.sort(
-            key=lambda x: x.get("salesByAsin", {}).get("unitsOrdered", 0),
+        # Sort by units ordered, reading it from the built rows so the
+        # nested report dicts are only walked once per ASIN
+        asin_rows = sorted(
+            map(_asin_row, sales_by_asin),
+            key=itemgetter(headers.index("Units Ordered")),
             reverse=True,
         )
 
-        rows = [headers]
-        for entry in sales_by_asin:
-            child_asin = entry.get("childAsin", "")
-            parent_asin = entry.get("parentAsin", "")
-            sku = entry.get("sku", "")
-            sales = entry.get("salesByAsin", {})
-            traffic = entry.get("trafficByAsin", {})
-
-            ordered_sales = sales.get("orderedProductSales", {})
-
-            rows.append([
-                child_asin or parent_asin,
-                parent_asin,
-                sku,
-                sales.get("unitsOrdered", 0),
-                ordered_sales.get("amount", 0),
-                sales.get("unitsShipped", 0),
-                traffic.get("sessions", 0),
-                traffic.get("pageViews", 0),
-                traffic.get("buyBoxPercentage", 0),
-                traffic.get("unitSessionPercentage", 0),
-            ])
-
-        ws.update("A1", rows)
-        print(f"  Wrote {len(sales_by_asin)} rows to Traffic-ByASIN")
+        rows = [headers, *asin_rows]
+        writes.append(("Traffic-ByASIN", rows))
+
+    sheets.write_tabs(writes)
+
+    for tab_name, rows in writes:
+        print(f"  Wrote {len(rows) - 1} rows to {tab_name}")
 
 
 def main() -> int:
@@ -10,20 +10,28 @@ Usage:
 """
 
 import argparse
-import gzip
-import json
 import sys
 import time
-from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache, partial
+from itertools import starmap
+from operator import itemgetter
 
-import requests
 from decouple import config
 from sp_api.api import Reports
 from sp_api.base import Marketplaces
 
+from ..amazon.documents import fetch_error_details, fetch_report_document
 
+
+# Shared read-only default for .get() on missing nested report objects
+_EMPTY: dict = {}
+
+
+@lru_cache(maxsize=1)
 def get_credentials() -> dict:
-    """Load SP-API credentials from environment."""
+    """Load SP-API credentials from environment (read once per process)."""
     return {
         "refresh_token": config("SP_API_REFRESH_TOKEN"),
         "lwa_app_id": config("SP_API_CLIENT_ID"),
@@ -31,6 +39,21 @@ def get_credentials() -> dict:
     }
 
 
+@lru_cache(maxsize=1)
+def _reports_client(credentials_key: tuple[tuple[str, str], ...]) -> Reports:
+    """Build the Reports client for a hashable credentials key."""
+    return Reports(credentials=dict(credentials_key), marketplace=Marketplaces.US)
+
+
+def get_reports_client(credentials: dict) -> Reports:
+    """Get the shared Reports client for these credentials.
+
+    Reusing one client keeps its cached LWA access token, so repeated
+    calls (e.g. status polls) skip a token exchange each time.
+    """
+    return _reports_client(tuple(sorted(credentials.items())))
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create argument parser."""
     parser = argparse.ArgumentParser(
@@ -94,21 +117,18 @@ Note: Brand Analytics reports can take 30-60 minutes to process.
 
 def get_last_complete_week() -> tuple[date, date]:
     """Get the last complete week (Sunday to Saturday)."""
-    today = date.today()
-    # Find last Saturday
-    days_since_saturday = (today.weekday() + 2) % 7
-    if days_since_saturday == 0:
-        days_since_saturday = 7  # If today is Saturday, use previous week
-    last_saturday = today - timedelta(days=days_since_saturday)
-    last_sunday = last_saturday - timedelta(days=6)
-    return last_sunday, last_saturday
+    today = date.today().toordinal()
+    # Find last Saturday (ordinal 1 is a Monday, so (ordinal + 1) % 7 counts
+    # days since Saturday); if today is Saturday, use previous week
+    last_saturday = today - ((today + 1) % 7 or 7)
+    return date.fromordinal(last_saturday - 6), date.fromordinal(last_saturday)
 
 
 def test_connection(credentials: dict) -> bool:
     """Test the SP-API connection."""
     print("Testing SP-API connection...")
     try:
-        report = Reports(credentials=credentials, marketplace=Marketplaces.US)
+        report = get_reports_client(credentials)
         res = report.get_reports(
             reportTypes=["GET_MERCHANT_LISTINGS_ALL_DATA"],
             pageSize=1,
@@ -122,7 +142,7 @@ def test_connection(credentials: dict) -> bool:
 
 def list_reports(credentials: dict) -> None:
     """List recent SQP reports."""
-    report = Reports(credentials=credentials, marketplace=Marketplaces.US)
+    report = get_reports_client(credentials)
 
     print("Recent SQP Reports:")
     print("-" * 80)
@@ -132,7 +152,23 @@ def list_reports(credentials: dict) -> None:
         pageSize=10,
     )
 
-    for r in res.payload.get("reports", []):
+    reports = res.payload.get("reports", [])
+
+    # Fetch error details for failed reports concurrently, printed in order below
+    error_docs = {
+        r.get("reportId"): r.get("reportDocumentId")
+        for r in reports
+        if r.get("processingStatus") == "FATAL" and r.get("reportDocumentId")
+    }
+    errors = {}
+    if error_docs:
+        with ThreadPoolExecutor(max_workers=min(8, len(error_docs))) as executor:
+            results = executor.map(
+                partial(fetch_error_details, report), error_docs.values()
+            )
+            errors = dict(zip(error_docs, results))
+
+    for r in reports:
         status = r.get("processingStatus")
         rid = r.get("reportId")
         created = r.get("createdTime", "")[:19]
@@ -142,18 +178,10 @@ def list_reports(credentials: dict) -> None:
         status_icon = "✓" if status == "DONE" else "✗" if status == "FATAL" else "⏳"
         print(f"{status_icon} {rid} | {status:<12} | ASIN: {asin} | {created}")
 
-        if status == "FATAL" and r.get("reportDocumentId"):
-            # Show error
-            doc_res = report.get_report_document(
-                reportDocumentId=r.get("reportDocumentId"),
-                download=False,
-            )
-            url = doc_res.payload.get("url")
-            response = requests.get(url)
-            data = gzip.decompress(response.content).decode("utf-8")
-            error_data = json.loads(data)
-            if "errorDetails" in error_data:
-                print(f"    Error: {error_data['errorDetails']}")
+        # Show error
+        error_details = errors.get(rid)
+        if error_details:
+            print(f"    Error: {error_details}")
 
 
 def request_report(
@@ -163,7 +191,7 @@ def request_report(
     end_date: date,
 ) -> str:
     """Request a new SQP report."""
-    report = Reports(credentials=credentials, marketplace=Marketplaces.US)
+    report = get_reports_client(credentials)
 
     print(f"Requesting SQP report...")
     print(f"  ASIN: {asin}")
@@ -190,7 +218,7 @@ def request_report(
 
 def check_report(credentials: dict, report_id: str) -> bool:
     """Check report status and download if ready."""
-    report = Reports(credentials=credentials, marketplace=Marketplaces.US)
+    report = get_reports_client(credentials)
 
     res = report.get_report(reportId=report_id)
     status = res.payload.get("processingStatus")
@@ -202,12 +230,8 @@ def check_report(credentials: dict, report_id: str) -> bool:
         download_and_display(report, doc_id)
         return True
     elif status == "FATAL" and doc_id:
-        doc_res = report.get_report_document(reportDocumentId=doc_id, download=False)
-        url = doc_res.payload.get("url")
-        response = requests.get(url)
-        data = gzip.decompress(response.content).decode("utf-8")
-        error_data = json.loads(data)
-        print(f"Error: {error_data.get('errorDetails', 'Unknown error')}")
+        error_details = fetch_error_details(report, doc_id)
+        print(f"Error: {error_details or 'Unknown error'}")
         return False
     elif status in ("IN_QUEUE", "IN_PROGRESS"):
         print("Report is still processing. Check again later.")
@@ -219,16 +243,7 @@ def check_report(credentials: dict, report_id: str) -> bool:
 
 def download_and_display(report: Reports, doc_id: str) -> None:
     """Download and display report data."""
-    doc_res = report.get_report_document(reportDocumentId=doc_id, download=False)
-    url = doc_res.payload.get("url")
-
-    response = requests.get(url)
-    if doc_res.payload.get("compressionAlgorithm") == "GZIP":
-        data = gzip.decompress(response.content).decode("utf-8")
-    else:
-        data = response.text
-
-    report_data = json.loads(data)
+    report_data = fetch_report_document(report, doc_id)
 
     if "errorDetails" in report_data:
         print(f"Error: {report_data['errorDetails']}")
@@ -243,42 +258,35 @@ def download_and_display(report: Reports, doc_id: str) -> None:
     print(f"Period: {spec.get('dataStartTime', '')[:10]} to {spec.get('dataEndTime', '')[:10]}")
     print("=" * 80)
 
-    # Group by ASIN
+    # Group display rows by ASIN, reading each entry's nested fields once
     by_asin = {}
     for entry in report_data.get("dataByAsin", []):
-        asin = entry.get("asin")
-        if asin not in by_asin:
-            by_asin[asin] = []
-        by_asin[asin].append(entry)
-
-    for asin, entries in by_asin.items():
-        print(f"\nASIN: {asin} ({len(entries)} search queries)")
+        sq = entry.get("searchQueryData", _EMPTY)
+        imp = entry.get("impressionData", _EMPTY)
+        clk = entry.get("clickData", _EMPTY)
+        pur = entry.get("purchaseData", _EMPTY)
+
+        by_asin.setdefault(entry.get("asin"), []).append((
+            (sq.get("searchQuery", "") or "")[:43],
+            sq.get("searchQueryVolume", 0) or 0,
+            imp.get("asinImpressionShare", 0) or 0,
+            clk.get("asinClickShare", 0) or 0,
+            pur.get("asinPurchaseShare", 0) or 0,
+        ))
+
+    for asin, rows in by_asin.items():
+        print(f"\nASIN: {asin} ({len(rows)} search queries)")
         print("-" * 80)
 
         # Sort by search volume
-        entries.sort(
-            key=lambda x: x.get("searchQueryData", {}).get("searchQueryVolume", 0) or 0,
-            reverse=True,
-        )
+        rows.sort(key=itemgetter(1), reverse=True)
 
         print(f"{'Search Query':<45} {'Vol':>6} {'Imp%':>6} {'Clk%':>6} {'Pur%':>6}")
         print("-" * 80)
 
-        for entry in entries:
-            sq = entry.get("searchQueryData", {})
-            query = (sq.get("searchQuery", "") or "")[:43]
-            volume = sq.get("searchQueryVolume", 0) or 0
-
-            imp = entry.get("impressionData", {})
-            imp_share = imp.get("asinImpressionShare", 0) or 0
-
-            clk = entry.get("clickData", {})
-            clk_share = clk.get("asinClickShare", 0) or 0
-
-            pur = entry.get("purchaseData", {})
-            pur_share = pur.get("asinPurchaseShare", 0) or 0
-
-            print(f"{query:<45} {volume:>6} {imp_share:>5.1f}% {clk_share:>5.1f}% {pur_share:>5.1f}%")
+        # Format all rows up front and write them in one call
+        fmt = "{:<45} {:>6} {:>5.1f}% {:>5.1f}% {:>5.1f}%\n".format
+        sys.stdout.write("".join(starmap(fmt, rows)))
 
     print("\n" + "=" * 80)
     print(f"Total: {len(report_data.get('dataByAsin', []))} search queries")
@@ -287,13 +295,17 @@ def download_and_display(report: Reports, doc_id: str) -> None:
 
 def wait_for_report(credentials: dict, report_id: str, max_wait: int = 3600) -> bool:
     """Wait for report to complete."""
-    report = Reports(credentials=credentials, marketplace=Marketplaces.US)
+    report = get_reports_client(credentials)
 
     print(f"Waiting for report {report_id} to complete...")
     print("(This can take 30-60 minutes. Press Ctrl+C to cancel.)")
 
     start_time = time.time()
-    check_interval = 30  # seconds
+    # Poll with exponential backoff, starting over whenever the status changes
+    min_interval = 30  # seconds
+    max_interval = 120
+    check_interval = min_interval
+    last_status = None
 
     while time.time() - start_time < max_wait:
         res = report.get_report(reportId=report_id)
@@ -303,6 +315,10 @@ def wait_for_report(credentials: dict, report_id: str, max_wait: int = 3600) ->
         elapsed = int(time.time() - start_time)
         print(f"  [{elapsed//60}m {elapsed%60}s] Status: {status}")
 
+        if status != last_status:
+            check_interval = min_interval
+            last_status = status
+
         if status == "DONE" and doc_id:
             print("\n[SUCCESS] Report ready!")
             download_and_display(report, doc_id)
@@ -310,18 +326,17 @@ def wait_for_report(credentials: dict, report_id: str, max_wait: int = 3600) ->
         elif status == "FATAL":
             print("\n[FAILED] Report failed")
             if doc_id:
-                doc_res = report.get_report_document(reportDocumentId=doc_id, download=False)
-                url = doc_res.payload.get("url")
-                response = requests.get(url)
-                data = gzip.decompress(response.content).decode("utf-8")
-                error_data = json.loads(data)
-                print(f"Error: {error_data.get('errorDetails', 'Unknown error')}")
+                error_details = fetch_error_details(report, doc_id)
+                print(f"Error: {error_details or 'Unknown error'}")
             return False
         elif status == "CANCELLED":
             print("\n[CANCELLED] Report was cancelled")
             return False
 
-        time.sleep(check_interval)
+        # Never sleep past the deadline
+        remaining = max_wait - (time.time() - start_time)
+        time.sleep(max(0, min(check_interval, remaining)))
+        check_interval = min(check_interval * 2, max_interval)
 
     print(f"\n[TIMEOUT] Report did not complete within {max_wait//60} minutes")
     return False
@@ -9,20 +9,26 @@ Usage:
 """
 
 import argparse
-import gzip
-import json
+import heapq
 import sys
 import time
-from datetime import date, timedelta
+from datetime import date
+from functools import lru_cache
 
-import requests
 from decouple import config
 from sp_api.api import Reports
 from sp_api.base import Marketplaces
 
+from ..amazon.documents import fetch_error_details, fetch_report_document
 
+
+# Shared read-only default for .get() on missing nested report objects
+_EMPTY: dict = {}
+
+
+@lru_cache(maxsize=1)
 def get_credentials() -> dict:
-    """Load SP-API credentials from environment."""
+    """Load SP-API credentials from environment (read once per process)."""
     return {
         "refresh_token": config("SP_API_REFRESH_TOKEN"),
         "lwa_app_id": config("SP_API_CLIENT_ID"),
@@ -30,6 +36,21 @@ def get_credentials() -> dict:
     }
 
 
+@lru_cache(maxsize=1)
+def _reports_client(credentials_key: tuple[tuple[str, str], ...]) -> Reports:
+    """Build the Reports client for a hashable credentials key."""
+    return Reports(credentials=dict(credentials_key), marketplace=Marketplaces.US)
+
+
+def get_reports_client(credentials: dict) -> Reports:
+    """Get the shared Reports client for these credentials.
+
+    Reusing one client keeps its cached LWA access token, so repeated
+    calls (e.g. status polls) skip a token exchange each time.
+    """
+    return _reports_client(tuple(sorted(credentials.items())))
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create argument parser."""
     parser = argparse.ArgumentParser(
@@ -107,9 +128,9 @@ Note: Reports typically take 5-15 minutes to process.
 
 def get_default_date_range() -> tuple[date, date]:
     """Get default date range (last 7 complete days)."""
-    today = date.today()
-    end_date = today - timedelta(days=1)  # Yesterday
-    start_date = end_date - timedelta(days=6)  # 7 days total
+    today = date.today().toordinal()
+    end_date = date.fromordinal(today - 1)  # Yesterday
+    start_date = date.fromordinal(today - 7)  # 7 days total
     return start_date, end_date
 
 
@@ -117,7 +138,7 @@ def test_connection(credentials: dict) -> bool:
     """Test the SP-API connection."""
     print("Testing SP-API connection...")
     try:
-        report = Reports(credentials=credentials, marketplace=Marketplaces.US)
+        report = get_reports_client(credentials)
         report.get_reports(
             reportTypes=["GET_MERCHANT_LISTINGS_ALL_DATA"],
             pageSize=1,
@@ -131,7 +152,7 @@ def test_connection(credentials: dict) -> bool:
 
 def list_reports(credentials: dict) -> None:
     """List recent Sales and Traffic reports."""
-    report = Reports(credentials=credentials, marketplace=Marketplaces.US)
+    report = get_reports_client(credentials)
 
     print("Recent Sales and Traffic Reports:")
     print("-" * 80)
@@ -161,7 +182,7 @@ def request_report(
     asin_granularity: str = "CHILD",
 ) -> str:
     """Request a new Sales and Traffic report."""
-    report = Reports(credentials=credentials, marketplace=Marketplaces.US)
+    report = get_reports_client(credentials)
 
     print(f"Requesting Sales and Traffic report...")
     print(f"  Period: {start_date} to {end_date}")
@@ -189,7 +210,7 @@ def request_report(
 
 def check_report(credentials: dict, report_id: str) -> bool:
     """Check report status and download if ready."""
-    report = Reports(credentials=credentials, marketplace=Marketplaces.US)
+    report = get_reports_client(credentials)
 
     res = report.get_report(reportId=report_id)
     status = res.payload.get("processingStatus")
@@ -201,12 +222,8 @@ def check_report(credentials: dict, report_id: str) -> bool:
         download_and_display(report, doc_id)
         return True
     elif status == "FATAL" and doc_id:
-        doc_res = report.get_report_document(reportDocumentId=doc_id, download=False)
-        url = doc_res.payload.get("url")
-        response = requests.get(url)
-        data = gzip.decompress(response.content).decode("utf-8")
-        error_data = json.loads(data)
-        print(f"Error: {error_data.get('errorDetails', 'Unknown error')}")
+        error_details = fetch_error_details(report, doc_id)
+        print(f"Error: {error_details or 'Unknown error'}")
         return False
     elif status in ("IN_QUEUE", "IN_PROGRESS"):
         print("Report is still processing. Check again later.")
@@ -218,16 +235,7 @@ def check_report(credentials: dict, report_id: str) -> bool:
 
 def download_and_display(report: Reports, doc_id: str) -> None:
     """Download and display report data."""
-    doc_res = report.get_report_document(reportDocumentId=doc_id, download=False)
-    url = doc_res.payload.get("url")
-
-    response = requests.get(url)
-    if doc_res.payload.get("compressionAlgorithm") == "GZIP":
-        data = gzip.decompress(response.content).decode("utf-8")
-    else:
-        data = response.text
-
-    report_data = json.loads(data)
+    report_data = fetch_report_document(report, doc_id)
 
     if "errorDetails" in report_data:
         print(f"Error: {report_data['errorDetails']}")
@@ -250,19 +258,22 @@ def download_and_display(report: Reports, doc_id: str) -> None:
         print(f"{'Date':<12} {'Units':>8} {'Sales':>12} {'Sessions':>10} {'PageViews':>10} {'BuyBox%':>8}")
         print("-" * 70)
 
+        # Format all rows up front and write them in one call
+        fmt = "{:<12} {:>8} ${:>10.2f} {:>10} {:>10} {:>7.1f}%\n".format
+        lines = []
         for entry in sales_by_date[:14]:  # Show first 2 weeks
-            dt = entry.get("date", "")
-            sales = entry.get("salesByDate", {})
-            traffic = entry.get("trafficByDate", {})
-
-            units = sales.get("unitsOrdered", 0)
-            ordered_sales = sales.get("orderedProductSales", {})
-            sales_amt = ordered_sales.get("amount", 0)
-            sessions = traffic.get("sessions", 0)
-            page_views = traffic.get("pageViews", 0)
-            buy_box = traffic.get("buyBoxPercentage", 0)
-
-            print(f"{dt:<12} {units:>8} ${sales_amt:>10.2f} {sessions:>10} {page_views:>10} {buy_box:>7.1f}%")
+            sales = entry.get("salesByDate", _EMPTY)
+            traffic = entry.get("trafficByDate", _EMPTY)
+
+            lines.append(fmt(
+                entry.get("date", ""),
+                sales.get("unitsOrdered", 0),
+                sales.get("orderedProductSales", _EMPTY).get("amount", 0),
+                traffic.get("sessions", 0),
+                traffic.get("pageViews", 0),
+                traffic.get("buyBoxPercentage", 0),
+            ))
+        sys.stdout.write("".join(lines))
 
     # Sales by ASIN
     sales_by_asin = report_data.get("salesAndTrafficByAsin", [])
@@ -271,25 +282,28 @@ def download_and_display(report: Reports, doc_id: str) -> None:
         print(f"{'ASIN':<12} {'SKU':<20} {'Units':>8} {'Sales':>12} {'Sessions':>10} {'BuyBox%':>8}")
         print("-" * 80)
 
-        # Sort by units ordered
-        sales_by_asin.sort(
-            key=lambda x: x.get("salesByAsin", {}).get("unitsOrdered", 0),
-            reverse=True,
+        # Top 20 by units ordered, without sorting the whole list
+        top_asins = heapq.nlargest(
+            20,
+            sales_by_asin,
+            key=lambda x: x.get("salesByAsin", _EMPTY).get("unitsOrdered", 0),
         )
 
-        for entry in sales_by_asin[:20]:  # Show top 20
-            asin = entry.get("childAsin", entry.get("parentAsin", "N/A"))
-            sku = entry.get("sku", "N/A")[:18]
-            sales = entry.get("salesByAsin", {})
-            traffic = entry.get("trafficByAsin", {})
-
-            units = sales.get("unitsOrdered", 0)
-            ordered_sales = sales.get("orderedProductSales", {})
-            sales_amt = ordered_sales.get("amount", 0)
-            sessions = traffic.get("sessions", 0)
-            buy_box = traffic.get("buyBoxPercentage", 0)
-
-            print(f"{asin:<12} {sku:<20} {units:>8} ${sales_amt:>10.2f} {sessions:>10} {buy_box:>7.1f}%")
+        fmt = "{:<12} {:<20} {:>8} ${:>10.2f} {:>10} {:>7.1f}%\n".format
+        lines = []
+        for entry in top_asins:
+            sales = entry.get("salesByAsin", _EMPTY)
+            traffic = entry.get("trafficByAsin", _EMPTY)
+
+            lines.append(fmt(
+                entry.get("childAsin", entry.get("parentAsin", "N/A")),
+                entry.get("sku", "N/A")[:18],
+                sales.get("unitsOrdered", 0),
+                sales.get("orderedProductSales", _EMPTY).get("amount", 0),
+                traffic.get("sessions", 0),
+                traffic.get("buyBoxPercentage", 0),
+            ))
+        sys.stdout.write("".join(lines))
 
     print("\n" + "=" * 100)
     print(f"Total: {len(sales_by_date)} date entries, {len(sales_by_asin)} ASIN entries")
@@ -298,13 +312,17 @@ def download_and_display(report: Reports, doc_id: str) -> None:
 
 def wait_for_report(credentials: dict, report_id: str, max_wait: int = 1800) -> bool:
     """Wait for report to complete."""
-    report = Reports(credentials=credentials, marketplace=Marketplaces.US)
+    report = get_reports_client(credentials)
 
     print(f"Waiting for report {report_id} to complete...")
     print("(Press Ctrl+C to cancel)")
 
     start_time = time.time()
-    check_interval = 15  # seconds
+    # Poll with exponential backoff, starting over whenever the status changes
+    min_interval = 15  # seconds
+    max_interval = 120
+    check_interval = min_interval
+    last_status = None
 
     while time.time() - start_time < max_wait:
         res = report.get_report(reportId=report_id)
@@ -314,6 +332,10 @@ def wait_for_report(credentials: dict, report_id: str, max_wait: int = 1800) ->
         elapsed = int(time.time() - start_time)
         print(f"  [{elapsed//60}m {elapsed%60}s] Status: {status}")
 
+        if status != last_status:
+            check_interval = min_interval
+            last_status = status
+
         if status == "DONE" and doc_id:
             print("\n[SUCCESS] Report ready!")
             download_and_display(report, doc_id)
@@ -321,18 +343,17 @@ def wait_for_report(credentials: dict, report_id: str, max_wait: int = 1800) ->
         elif status == "FATAL":
             print("\n[FAILED] Report failed")
             if doc_id:
-                doc_res = report.get_report_document(reportDocumentId=doc_id, download=False)
-                url = doc_res.payload.get("url")
-                response = requests.get(url)
-                data = gzip.decompress(response.content).decode("utf-8")
-                error_data = json.loads(data)
-                print(f"Error: {error_data.get('errorDetails', 'Unknown error')}")
+                error_details = fetch_error_details(report, doc_id)
+                print(f"Error: {error_details or 'Unknown error'}")
             return False
         elif status == "CANCELLED":
             print("\n[CANCELLED] Report was cancelled")
             return False
 
-        time.sleep(check_interval)
+        # Never sleep past the deadline
+        remaining = max_wait - (time.time() - start_time)
+        time.sleep(max(0, min(check_interval, remaining)))
+        check_interval = min(check_interval * 2, max_interval)
 
     print(f"\n[TIMEOUT] Report did not complete within {max_wait//60} minutes")
     return False
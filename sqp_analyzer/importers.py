@@ -2,6 +2,7 @@
 
 import csv
 import re
+from collections.abc import Iterator
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any
@@ -122,42 +123,48 @@ def import_excel(
 def import_folder(
     folder_path: str | Path,
     asin: str,
-) -> list[WeeklySnapshot]:
+) -> Iterator[WeeklySnapshot]:
     """Import all CSV/Excel files from a folder.
 
-    Expects files named with dates (e.g., "SQP_2025-01-15.csv").
+    Expects files named with dates (e.g., "SQP_2025-01-15.csv"). Files are
+    parsed lazily, one per iteration step, so only the snapshot currently
+    being consumed has to be held in memory.
 
     Args:
         folder_path: Path to folder containing export files
         asin: Parent ASIN for this data
 
     Returns:
-        List of WeeklySnapshots, one per file
+        Iterator of WeeklySnapshots, one per file with records
     """
     folder_path = Path(folder_path)
 
     if not folder_path.is_dir():
         raise NotADirectoryError(f"Not a directory: {folder_path}")
 
-    snapshots = []
-
     # Find all CSV and Excel files
     files = list(folder_path.glob("*.csv")) + list(folder_path.glob("*.xlsx"))
 
-    for file_path in sorted(files):
-        try:
-            if file_path.suffix.lower() == ".csv":
-                snapshot = import_csv(file_path, asin)
-            else:
-                snapshot = import_excel(file_path, asin)
+    snapshots = (_import_file(file_path, asin) for file_path in sorted(files))
+    return filter(None, snapshots)
 
-            if snapshot.records:
-                snapshots.append(snapshot)
-                print(f"  Imported {file_path.name}: {len(snapshot.records)} keywords")
-        except Exception as e:
-            print(f"  Warning: Failed to import {file_path.name}: {e}")
 
-    return snapshots
+def _import_file(file_path: Path, asin: str) -> WeeklySnapshot | None:
+    """Import one folder file, or return None if it is empty or unreadable."""
+    try:
+        if file_path.suffix.lower() == ".csv":
+            snapshot = import_csv(file_path, asin)
+        else:
+            snapshot = import_excel(file_path, asin)
+    except Exception as e:
+        print(f"  Warning: Failed to import {file_path.name}: {e}")
+        return None
+
+    if not snapshot.records:
+        return None
+
+    print(f"  Imported {file_path.name}: {len(snapshot.records)} keywords")
+    return snapshot
 
 
 def _parse_rows(
@@ -1,15 +1,20 @@
 """Main entry point for SQP Analyzer."""
 
 import argparse
+import heapq
 import sys
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 
-from .config import load_config, AppConfig
+from .config import load_config, AppConfig, SheetsConfig, SPAPIConfig
 from .amazon import BrandAnalyticsClient
 from .sheets import SheetsClient
 from .parsers import parse_api_report
-from .models import ASINSummary, WeeklySnapshot
+from .models import ASINSummary, KeywordCategory, WeeklySnapshot
 from .analyzers import (
     DiagnosticAnalyzer,
     KeywordCategorizer,
@@ -20,11 +25,31 @@ from .analyzers import (
 from .importers import import_csv, import_excel, import_folder
 
 
+@lru_cache(maxsize=None)
+def get_api_client(config: SPAPIConfig) -> BrandAnalyticsClient:
+    """Get the SP-API client for a configuration.
+
+    One client is shared per process, so processing several ASINs reuses
+    its access token and connections.
+    """
+    return BrandAnalyticsClient(config)
+
+
+@lru_cache(maxsize=None)
+def get_sheets_client(config: SheetsConfig) -> SheetsClient:
+    """Get the Google Sheets client for a configuration.
+
+    One client is shared per process, so processing several ASINs reuses
+    its authorized session and opened spreadsheet.
+    """
+    return SheetsClient(config)
+
+
 def import_sqp_data(
     file_path: str,
     asin: str,
     week_date: date | None = None,
-) -> list[WeeklySnapshot]:
+) -> Iterable[WeeklySnapshot]:
     """Import SQP data from CSV/Excel file or folder.
 
     Args:
@@ -33,7 +58,7 @@ def import_sqp_data(
         week_date: Optional week date (auto-detected if not provided)
 
     Returns:
-        List of WeeklySnapshots
+        WeeklySnapshots; folder files are parsed lazily as they are iterated
     """
     path = Path(file_path)
 
@@ -57,7 +82,7 @@ def import_sqp_data(
 def test_api_connection(config: AppConfig) -> bool:
     """Test SP-API connection."""
     print("Testing SP-API connection...")
-    client = BrandAnalyticsClient(config.sp_api)
+    client = get_api_client(config.sp_api)
     result = client.test_connection()
 
     if result["success"]:
@@ -71,7 +96,7 @@ def test_api_connection(config: AppConfig) -> bool:
 def test_sheets_connection(config: AppConfig) -> bool:
     """Test Google Sheets connection."""
     print("Testing Google Sheets connection...")
-    client = SheetsClient(config.sheets)
+    client = get_sheets_client(config.sheets)
 
     if client.test_connection():
         print("✓ Successfully connected to Google Sheets")
@@ -87,7 +112,7 @@ def fetch_sqp_data(
     weeks: int = 12,
 ) -> list[WeeklySnapshot]:
     """Fetch SQP data for an ASIN."""
-    client = BrandAnalyticsClient(config.sp_api)
+    client = get_api_client(config.sp_api)
     print(f"Fetching {weeks} weeks of SQP data for {asin}...")
 
     responses = client.get_weekly_reports(asin, weeks)
@@ -106,37 +131,74 @@ def fetch_sqp_data(
 
 def analyze_snapshots(
     config: AppConfig,
-    snapshots: list[WeeklySnapshot],
+    snapshots: Iterable[WeeklySnapshot],
+    workers: int = 1,
 ) -> dict:
-    """Run all analysis on snapshots."""
-    if not snapshots:
-        return {}
+    """Run all analysis on snapshots.
+
+    Snapshots are consumed in a single pass: each one is folded into the
+    trend data and then dropped unless it is the most recent, so a lazily
+    imported folder never has every week in memory at once.
 
-    # Use most recent snapshot for categorization
-    latest = max(snapshots, key=lambda s: s.week_date)
+    With workers > 1, categorization and placements run in worker processes
+    while price flags and diagnostics (which depend on them) run here. This
+    only pays off for large snapshots, since records and results are
+    pickled across the process boundary.
+    """
+    if isinstance(snapshots, list):
+        # Fold oldest first, as TrendTracker.analyze_trends() does
+        snapshots = sorted(snapshots, key=attrgetter("week_date"))
+
+    # Track trends and the most recent snapshot as snapshots stream in
+    trend_tracker = TrendTracker()
+    latest = None
+    for snapshot in snapshots:
+        trend_tracker.add_snapshot(snapshot)
+        if latest is None or snapshot.week_date > latest.week_date:
+            latest = snapshot
+
+    if latest is None:
+        return {}
 
     # Initialize analyzers
     categorizer = KeywordCategorizer(config.thresholds)
-    trend_tracker = TrendTracker()
     price_benchmark = PriceBenchmark(config.thresholds)
     diagnostic_analyzer = DiagnosticAnalyzer(config.thresholds)
     placement_recommender = PlacementRecommender(config.thresholds)
 
     # Run analysis
-    categorized = categorizer.categorize(latest)
-    trends = trend_tracker.analyze_trends(snapshots)
-    price_flags = price_benchmark.analyze(latest)
+    if workers > 1:
+        # Only categorize and placements run in the pool, so at most two
+        # workers are ever busy. Workers use the platform's default start
+        # method; forcing fork is unsafe after threads, SSL or system
+        # frameworks have been used.
+        with ProcessPoolExecutor(max_workers=min(workers, 2)) as executor:
+            categorized_future = executor.submit(categorizer.categorize, latest)
+            placements_future = executor.submit(placement_recommender.analyze, latest)
+
+            trends = trend_tracker.finalize()
+            price_flags = price_benchmark.analyze(latest)
+            diagnostics = diagnostic_analyzer.analyze(latest, price_flags)
+
+            categorized = categorized_future.result()
+            placements = placements_future.result()
+    else:
+        categorized = categorizer.categorize(latest)
+        trends = trend_tracker.finalize()
+        price_flags = price_benchmark.analyze(latest)
 
-    # Run new diagnostic and placement analysis
-    diagnostics = diagnostic_analyzer.analyze(latest, price_flags)
-    placements = placement_recommender.analyze(latest)
+        # Run new diagnostic and placement analysis
+        diagnostics = diagnostic_analyzer.analyze(latest, price_flags)
+        placements = placement_recommender.analyze(latest)
+
+    by_category = categorizer.group_by_category(categorized)
 
     return {
         "latest_snapshot": latest,
         "categorized": categorized,
-        "bread_butter": categorizer.get_bread_butter(categorized),
-        "opportunities": categorizer.get_opportunities(categorized),
-        "leaks": categorizer.get_leaks(categorized),
+        "bread_butter": by_category[KeywordCategory.BREAD_BUTTER],
+        "opportunities": by_category[KeywordCategory.OPPORTUNITY],
+        "leaks": by_category[KeywordCategory.LEAK],
         "trends": trends,
         "price_flags": price_flags,
         "diagnostics": diagnostics,
@@ -154,107 +216,97 @@ def write_results_to_sheets(
     config: AppConfig,
     asin: str,
     analysis: dict,
-    snapshots: list[WeeklySnapshot],
 ) -> None:
     """Write analysis results to Google Sheets."""
-    client = SheetsClient(config.sheets)
+    client = get_sheets_client(config.sheets)
 
     print("Writing results to Google Sheets...")
 
-    # Write weekly data for most recent week
-    if snapshots:
-        latest = analysis["latest_snapshot"]
-        print(f"  Writing weekly data for {latest.week_date}...")
-        client.write_weekly_data(
-            latest.week_date,
-            [r.to_dict() for r in latest.records],
-        )
-
-    # Write categorized keywords
-    if analysis.get("bread_butter"):
-        print(f"  Writing {len(analysis['bread_butter'])} Bread & Butter keywords...")
-        headers = [
-            "Search Query", "ASIN", "Category", "Imp Share",
-            "Click Share", "Purchase Share", "Volume", "Recommended Action"
-        ]
-        client.write_categorized_keywords(
-            "SQP-BreadButter",
-            [k.to_dict() for k in analysis["bread_butter"]],
-            headers,
-        )
-
-    if analysis.get("opportunities"):
-        print(f"  Writing {len(analysis['opportunities'])} Opportunity keywords...")
-        headers = [
-            "Search Query", "ASIN", "Category", "Imp Share",
-            "Click Share", "Purchase Share", "Volume", "Recommended Action"
-        ]
-        client.write_categorized_keywords(
-            "SQP-Opportunities",
-            [k.to_dict() for k in analysis["opportunities"]],
-            headers,
-        )
-
-    if analysis.get("leaks"):
-        print(f"  Writing {len(analysis['leaks'])} Leak keywords...")
-        headers = [
-            "Search Query", "ASIN", "Category", "Imp Share",
-            "Click Share", "Purchase Share", "Volume", "Recommended Action"
-        ]
-        client.write_categorized_keywords(
-            "SQP-Leaks",
-            [k.to_dict() for k in analysis["leaks"]],
-            headers,
-        )
-
-    # Write trends
-    if analysis.get("trends"):
-        print(f"  Writing {len(analysis['trends'])} trend records...")
-        client.write_trends([t.to_dict() for t in analysis["trends"]])
-
-    # Write price flags
-    if analysis.get("price_flags"):
-        print(f"  Writing {len(analysis['price_flags'])} price flags...")
-        client.write_price_flags([f.to_dict() for f in analysis["price_flags"]])
-
-    # Write diagnostics
-    if analysis.get("diagnostics"):
-        print(f"  Writing {len(analysis['diagnostics'])} diagnostics...")
-        client.write_diagnostics([d.to_dict() for d in analysis["diagnostics"]])
-
-        # Write top 50 opportunities
-        sorted_diagnostics = sorted(
-            analysis["diagnostics"],
-            key=lambda d: d.opportunity_score,
-            reverse=True,
+    # Queue every tab and send them together in one batched update
+    with client.batch() as writes:
+        # Write weekly data for most recent week
+        latest = analysis.get("latest_snapshot")
+        if latest and latest.records:
+            client.write_weekly_data(
+                latest.week_date,
+                latest.records,
+            )
+
+        # Write categorized keywords
+        if analysis.get("bread_butter"):
+            headers = [
+                "Search Query", "ASIN", "Category", "Imp Share",
+                "Click Share", "Purchase Share", "Volume", "Recommended Action"
+            ]
+            client.write_categorized_keywords(
+                "SQP-BreadButter",
+                analysis["bread_butter"],
+                headers,
+            )
+
+        if analysis.get("opportunities"):
+            headers = [
+                "Search Query", "ASIN", "Category", "Imp Share",
+                "Click Share", "Purchase Share", "Volume", "Recommended Action"
+            ]
+            client.write_categorized_keywords(
+                "SQP-Opportunities",
+                analysis["opportunities"],
+                headers,
+            )
+
+        if analysis.get("leaks"):
+            headers = [
+                "Search Query", "ASIN", "Category", "Imp Share",
+                "Click Share", "Purchase Share", "Volume", "Recommended Action"
+            ]
+            client.write_categorized_keywords(
+                "SQP-Leaks",
+                analysis["leaks"],
+                headers,
+            )
+
+        # Write trends
+        if analysis.get("trends"):
+            client.write_trends(analysis["trends"])
+
+        # Write price flags
+        if analysis.get("price_flags"):
+            client.write_price_flags(analysis["price_flags"])
+
+        # Write diagnostics
+        if analysis.get("diagnostics"):
+            client.write_diagnostics(analysis["diagnostics"])
+
+            # Write top 50 opportunities
+            top_opportunities = heapq.nlargest(
+                50, analysis["diagnostics"], key=attrgetter("opportunity_score")
+            )
+            client.write_opportunity_ranking(top_opportunities)
+
+        # Write placements
+        if analysis.get("placements"):
+            client.write_placements(analysis["placements"])
+
+        # Build and write summary
+        summary = analysis.get("summary", {})
+        categories = summary.get("categories", {})
+        prices = summary.get("prices", {})
+
+        summary_record = ASINSummary(
+            asin=asin,
+            total_keywords=categories.get("total", 0),
+            bread_butter_count=categories.get("bread_butter", 0),
+            opportunities_count=categories.get("opportunities", 0),
+            leaks_count=categories.get("leaks", 0),
+            price_flagged_count=prices.get("total_flagged", 0),
+            health_score=calculate_health_score(categories, prices),
+            last_updated=date.today(),
         )
-        top_opportunities = sorted_diagnostics[:50]
-        print(f"  Writing top {len(top_opportunities)} opportunities...")
-        client.write_opportunity_ranking([d.to_dict() for d in top_opportunities])
-
-    # Write placements
-    if analysis.get("placements"):
-        print(f"  Writing {len(analysis['placements'])} placements...")
-        client.write_placements([p.to_dict() for p in analysis["placements"]])
 
-    # Build and write summary
-    summary = analysis.get("summary", {})
-    categories = summary.get("categories", {})
-    prices = summary.get("prices", {})
-
-    summary_record = ASINSummary(
-        asin=asin,
-        total_keywords=categories.get("total", 0),
-        bread_butter_count=categories.get("bread_butter", 0),
-        opportunities_count=categories.get("opportunities", 0),
-        leaks_count=categories.get("leaks", 0),
-        price_flagged_count=prices.get("total_flagged", 0),
-        health_score=calculate_health_score(categories, prices),
-        last_updated=date.today(),
-    )
+        client.write_summary([summary_record])
 
-    print("  Writing summary...")
-    client.write_summary([summary_record.to_dict()])
+    print(f"  Wrote {len(writes)} tabs: {', '.join(tab for tab, _ in writes)}")
 
 
 def calculate_health_score(
@@ -288,12 +340,49 @@ def calculate_health_score(
     return max(0, min(100, base_score - leak_penalty - price_penalty))
 
 
+def print_summary(analysis: dict) -> None:
+    """Print the category, diagnostic and placement counts of an analysis."""
+    summary = analysis.get("summary", {})
+    categories = summary.get("categories", {})
+    prices = summary.get("prices", {})
+    diagnostics = summary.get("diagnostics", {})
+    placements = summary.get("placements", {})
+
+    lines = [
+        "",
+        "Analysis Summary:",
+        f"  Total keywords: {categories.get('total', 0)}",
+        f"  Bread & Butter: {categories.get('bread_butter', 0)}",
+        f"  Opportunities: {categories.get('opportunities', 0)}",
+        f"  Leaks: {categories.get('leaks', 0)}",
+        f"  Price flagged: {prices.get('total_flagged', 0)}",
+        "",
+        "Diagnostics:",
+        f"  Ghost (not ranking): {diagnostics.get('ghost', 0)}",
+        f"  Window Shopper (low CTR): {diagnostics.get('window_shopper', 0)}",
+        f"  Price Problem: {diagnostics.get('price_problem', 0)}",
+        f"  Healthy: {diagnostics.get('healthy', 0)}",
+        "",
+        "Placements:",
+        f"  Title: {placements.get('title', 0)}",
+        f"  Bullets: {placements.get('bullets', 0)}",
+        f"  Backend: {placements.get('backend', 0)}",
+        f"  Description: {placements.get('description', 0)}",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def process_asin(
     config: AppConfig,
     asin: str,
     weeks: int = 12,
+    workers: int = 1,
+    dry_run: bool = False,
 ) -> None:
-    """Process a single ASIN: fetch, analyze, write."""
+    """Process a single ASIN: fetch, analyze, write.
+
+    With dry_run, stops after the summary without building any sheet rows.
+    """
     print(f"\n{'='*60}")
     print(f"Processing ASIN: {asin}")
     print('='*60)
@@ -306,32 +395,17 @@ def process_asin(
         return
 
     # Analyze
-    analysis = analyze_snapshots(config, snapshots)
+    analysis = analyze_snapshots(config, snapshots, workers)
 
-    # Print summary
-    summary = analysis.get("summary", {})
-    categories = summary.get("categories", {})
-    diagnostics_summary = summary.get("diagnostics", {})
-    placements_summary = summary.get("placements", {})
-    print(f"\nAnalysis Summary:")
-    print(f"  Total keywords: {categories.get('total', 0)}")
-    print(f"  Bread & Butter: {categories.get('bread_butter', 0)}")
-    print(f"  Opportunities: {categories.get('opportunities', 0)}")
-    print(f"  Leaks: {categories.get('leaks', 0)}")
-    print(f"  Price flagged: {summary.get('prices', {}).get('total_flagged', 0)}")
-    print(f"\nDiagnostics:")
-    print(f"  Ghost (not ranking): {diagnostics_summary.get('ghost', 0)}")
-    print(f"  Window Shopper (low CTR): {diagnostics_summary.get('window_shopper', 0)}")
-    print(f"  Price Problem: {diagnostics_summary.get('price_problem', 0)}")
-    print(f"  Healthy: {diagnostics_summary.get('healthy', 0)}")
-    print(f"\nPlacements:")
-    print(f"  Title: {placements_summary.get('title', 0)}")
-    print(f"  Bullets: {placements_summary.get('bullets', 0)}")
-    print(f"  Backend: {placements_summary.get('backend', 0)}")
-    print(f"  Description: {placements_summary.get('description', 0)}")
+    print_summary(analysis)
+
+    if dry_run:
+        print(f"\nDry run complete for {asin}")
+        print(f"  Would write {len(analysis.get('categorized', []))} keywords")
+        return
 
     # Write to sheets
-    write_results_to_sheets(config, asin, analysis, snapshots)
+    write_results_to_sheets(config, asin, analysis)
 
     print(f"\nCompleted processing {asin}")
 
@@ -367,6 +441,15 @@ def main():
         action="store_true",
         help="Fetch and analyze but don't write to sheets",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Processes to run independent analyzers in (default: 1); "
+            "values above 2 have no effect"
+        ),
+    )
     parser.add_argument(
         "--import-csv",
         type=str,
@@ -394,9 +477,24 @@ def main():
 
     args = parser.parse_args()
 
+    # Sections are loaded lazily, so load the ones this run needs up front
+    # to report a missing variable before any work starts
+    if args.test_api:
+        sections = ["sp_api"]
+    elif args.test_sheets:
+        sections = ["sheets"]
+    else:
+        sections = ["thresholds"]
+        if not (args.import_csv or args.import_excel or args.import_folder):
+            sections.append("sp_api")
+        if not (args.dry_run and args.asin):
+            sections.append("sheets")
+
     # Load configuration
     try:
         config = load_config()
+        for section in sections:
+            getattr(config, section)
     except Exception as e:
         print(f"Error loading configuration: {e}")
         print("Make sure .env file exists with required credentials")
@@ -440,37 +538,17 @@ def main():
             print(f"Error importing data: {e}")
             sys.exit(1)
 
-        if not snapshots:
+        # Analyze; folder files are parsed as the analysis consumes them
+        analysis = analyze_snapshots(config, snapshots, args.workers)
+
+        if not analysis:
             print("No data imported")
             sys.exit(1)
 
-        # Analyze
-        analysis = analyze_snapshots(config, snapshots)
-
-        # Print summary
-        summary = analysis.get("summary", {})
-        categories = summary.get("categories", {})
-        diagnostics_summary = summary.get("diagnostics", {})
-        placements_summary = summary.get("placements", {})
-        print(f"\nAnalysis Summary:")
-        print(f"  Total keywords: {categories.get('total', 0)}")
-        print(f"  Bread & Butter: {categories.get('bread_butter', 0)}")
-        print(f"  Opportunities: {categories.get('opportunities', 0)}")
-        print(f"  Leaks: {categories.get('leaks', 0)}")
-        print(f"  Price flagged: {summary.get('prices', {}).get('total_flagged', 0)}")
-        print(f"\nDiagnostics:")
-        print(f"  Ghost (not ranking): {diagnostics_summary.get('ghost', 0)}")
-        print(f"  Window Shopper (low CTR): {diagnostics_summary.get('window_shopper', 0)}")
-        print(f"  Price Problem: {diagnostics_summary.get('price_problem', 0)}")
-        print(f"  Healthy: {diagnostics_summary.get('healthy', 0)}")
-        print(f"\nPlacements:")
-        print(f"  Title: {placements_summary.get('title', 0)}")
-        print(f"  Bullets: {placements_summary.get('bullets', 0)}")
-        print(f"  Backend: {placements_summary.get('backend', 0)}")
-        print(f"  Description: {placements_summary.get('description', 0)}")
+        print_summary(analysis)
 
         if not args.dry_run:
-            write_results_to_sheets(config, asin, analysis, snapshots)
+            write_results_to_sheets(config, asin, analysis)
 
         print("\nImport complete!")
         sys.exit(0)
@@ -481,7 +559,7 @@ def main():
     else:
         # Read from Google Sheet
         print("Reading ASINs from Google Sheet...")
-        sheets_client = SheetsClient(config.sheets)
+        sheets_client = get_sheets_client(config.sheets)
         asins = sheets_client.get_active_asins()
         print(f"Found {len(asins)} active ASINs")
 
@@ -492,14 +570,7 @@ def main():
     # Process each ASIN
     for asin in asins:
         try:
-            if args.dry_run:
-                snapshots = fetch_sqp_data(config, asin, args.weeks)
-                if snapshots:
-                    analysis = analyze_snapshots(config, snapshots)
-                    print(f"Dry run complete for {asin}")
-                    print(f"  Would write {len(analysis.get('categorized', []))} keywords")
-            else:
-                process_asin(config, asin, args.weeks)
+            process_asin(config, asin, args.weeks, args.workers, args.dry_run)
         except Exception as e:
             print(f"Error processing {asin}: {e}")
             continue
@@ -1,12 +1,27 @@
 """Core data models for SQP Analyzer."""
 
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
-from typing import Any
+from operator import attrgetter
+from typing import Any, ClassVar
 
 
-class KeywordCategory(Enum):
+class _StrEnum(str, Enum):
+    """Enum whose members are, print and format as their string values.
+
+    Works like enum.StrEnum (Python 3.11+) while still supporting 3.10.
+    """
+
+    def __str__(self) -> str:
+        return self.value
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self.value, format_spec)
+
+
+class KeywordCategory(_StrEnum):
     """Keyword categorization."""
     BREAD_BUTTER = "bread_butter"
     OPPORTUNITY = "opportunity"
@@ -14,21 +29,21 @@ class KeywordCategory(Enum):
     UNCATEGORIZED = "uncategorized"
 
 
-class TrendDirection(Enum):
+class TrendDirection(_StrEnum):
     """Trend direction indicator."""
     GROWING = "growing"
     STABLE = "stable"
     DECLINING = "declining"
 
 
-class PriceSeverity(Enum):
+class PriceSeverity(_StrEnum):
     """Price competitiveness severity levels."""
     OK = "ok"
     WARNING = "warning"
     CRITICAL = "critical"
 
 
-class RankStatus(Enum):
+class RankStatus(_StrEnum):
     """Estimated page position based on impression share."""
     TOP_3 = "top_3"           # >20% imp share
     PAGE_1_HIGH = "page_1_high"  # 10-20%
@@ -36,7 +51,7 @@ class RankStatus(Enum):
     INVISIBLE = "invisible"       # <1%
 
 
-class DiagnosticType(Enum):
+class DiagnosticType(_StrEnum):
     """Keyword diagnostic types for root cause analysis."""
     GHOST = "ghost"              # High volume, no impressions
     WINDOW_SHOPPER = "window_shopper"  # Seen but not clicked
@@ -44,7 +59,7 @@ class DiagnosticType(Enum):
     HEALTHY = "healthy"
 
 
-class PlacementTarget(Enum):
+class PlacementTarget(_StrEnum):
     """Recommended keyword placement location."""
     TITLE = "title"
     BULLETS = "bullets"
@@ -52,8 +67,162 @@ class PlacementTarget(Enum):
     DESCRIPTION = "description"
 
 
-@dataclass
-class SQPRecord:
+Column = str | Callable[[Any], Any]
+
+
+class SheetModel:
+    """Base for models written to sheets, driven by their _COLUMNS map."""
+
+    __slots__ = ()
+
+    _COLUMNS: ClassVar[dict[str, Column]] = {}
+    # Every header in to_dict() order, and the row getter for them
+    _HEADERS: ClassVar[tuple[str, ...]] = ()
+    _ALL_COLUMNS: ClassVar[Callable[[Any], list[Any]]]
+    # Row getters already built for this class, by header tuple
+    _ROW_GETTERS: ClassVar[dict[tuple[str, ...], Callable[[Any], list[Any]]]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._ROW_GETTERS = {}
+        cls._HEADERS = tuple(cls._COLUMNS)
+        cls._ALL_COLUMNS = staticmethod(cls.row_getter(cls._HEADERS))
+
+    @classmethod
+    def row_getter(cls, headers: Iterable[str]) -> Callable[[Any], list[Any]]:
+        """Resolve headers once into a function that builds a record's row.
+
+        Unknown headers give "". When every header is a plain attribute the
+        whole row comes from one operator.attrgetter call. Getters are kept
+        per class, so each header list is only resolved once.
+        """
+        headers = tuple(headers)
+        get_row = cls._ROW_GETTERS.get(headers)
+        if get_row is None:
+            get_row = cls._ROW_GETTERS[headers] = cls._build_row_getter(headers)
+        return get_row
+
+    @classmethod
+    def _build_row_getter(
+        cls, headers: tuple[str, ...]
+    ) -> Callable[[Any], list[Any]]:
+        columns = [cls._COLUMNS.get(h) for h in headers]
+        if columns and all(isinstance(column, str) for column in columns):
+            get = attrgetter(*columns)
+            if len(columns) == 1:
+                return lambda obj: [get(obj)]
+            return lambda obj: list(get(obj))
+
+        getters = [cls._getter(h, column) for h, column in zip(headers, columns)]
+        return lambda obj: [get(obj) for get in getters]
+
+    @classmethod
+    def _getter(cls, header: str, column: Column | None) -> Callable[[Any], Any]:
+        """Getter for one header; column is None for unknown headers."""
+        if column is None:
+            return lambda obj: ""
+        if isinstance(column, str):
+            return attrgetter(column)
+        return column
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for sheet output."""
+        return dict(zip(self._HEADERS, self._ALL_COLUMNS(self)))
+
+    def to_row(self, headers: Iterable[str]) -> list[Any]:
+        """Convert to a sheet row in header order ("" for unknown headers)."""
+        return self.row_getter(headers)(self)
+
+
+# Sheet columns for each model, in to_dict() order: header -> attribute name,
+# or a callable for computed columns. The enums above are string enums, so enum
+# columns are written as their values directly.
+_SQP_RECORD_COLUMNS: dict[str, Column] = {
+    "Search Query": "search_query",
+    "ASIN": "asin",
+    "Week": lambda r: r.week_date.isoformat(),
+    "Volume": "search_volume",
+    "Score": "search_score",
+    "Imp Total": "impressions_total",
+    "Imp ASIN": "impressions_asin",
+    "Imp Share": "impressions_share",
+    "Click Total": "clicks_total",
+    "Click ASIN": "clicks_asin",
+    "Click Share": "clicks_share",
+    "Purchase Total": "purchases_total",
+    "Purchase ASIN": "purchases_asin",
+    "Purchase Share": "purchases_share",
+    "ASIN Price": "asin_price",
+    "Market Price": "market_price",
+}
+
+_CATEGORIZED_KEYWORD_COLUMNS: dict[str, Column] = {
+    "Search Query": "search_query",
+    "ASIN": "asin",
+    "Category": "category",
+    "Imp Share": "impressions_share",
+    "Click Share": "clicks_share",
+    "Purchase Share": "purchases_share",
+    "Volume": "search_volume",
+    "Recommended Action": "action",
+}
+
+_TREND_RECORD_COLUMNS: dict[str, Column] = {
+    "Search Query": "search_query",
+    "ASIN": "asin",
+    "Trend Direction": "trend_direction",
+    "Growth %": "growth_percent",
+}
+
+_PRICE_FLAG_COLUMNS: dict[str, Column] = {
+    "Search Query": "search_query",
+    "ASIN": "asin",
+    "ASIN Price": "asin_price",
+    "Market Price": "market_price",
+    "Price Diff %": "price_diff_percent",
+    "Severity": "severity",
+    "Imp Share": "impressions_share",
+    "Purchase Share": "purchases_share",
+}
+
+_ASIN_SUMMARY_COLUMNS: dict[str, Column] = {
+    "ASIN": "asin",
+    "Product Name": "product_name",
+    "Total Keywords": "total_keywords",
+    "Bread & Butter": "bread_butter_count",
+    "Opportunities": "opportunities_count",
+    "Leaks": "leaks_count",
+    "Price Flagged": "price_flagged_count",
+    "Health Score": "health_score",
+    "Last Updated": lambda s: s.last_updated.isoformat() if s.last_updated else "",
+}
+
+_KEYWORD_DIAGNOSTIC_COLUMNS: dict[str, Column] = {
+    "Search Query": "search_query",
+    "ASIN": "asin",
+    "Diagnostic": "diagnostic_type",
+    "Rank Status": "rank_status",
+    "Opportunity Score": "opportunity_score",
+    "Volume": "search_volume",
+    "Imp Share": "impressions_share",
+    "Click Share": "clicks_share",
+    "Purchase Share": "purchases_share",
+    "Recommended Fix": "recommended_fix",
+}
+
+_KEYWORD_PLACEMENT_COLUMNS: dict[str, Column] = {
+    "Search Query": "search_query",
+    "ASIN": "asin",
+    "Placement": "placement",
+    "Priority": "priority",
+    "Volume": "search_volume",
+    "Click Share": "clicks_share",
+    "Reasoning": "reasoning",
+}
+
+
+@dataclass(slots=True)
+class SQPRecord(SheetModel):
     """Single SQP data record for a search query."""
     search_query: str
     asin: str
@@ -82,26 +251,7 @@ class SQPRecord:
     asin_price: float | None = None
     market_price: float | None = None
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for sheet output."""
-        return {
-            "Search Query": self.search_query,
-            "ASIN": self.asin,
-            "Week": self.week_date.isoformat(),
-            "Volume": self.search_volume,
-            "Score": self.search_score,
-            "Imp Total": self.impressions_total,
-            "Imp ASIN": self.impressions_asin,
-            "Imp Share": self.impressions_share,
-            "Click Total": self.clicks_total,
-            "Click ASIN": self.clicks_asin,
-            "Click Share": self.clicks_share,
-            "Purchase Total": self.purchases_total,
-            "Purchase ASIN": self.purchases_asin,
-            "Purchase Share": self.purchases_share,
-            "ASIN Price": self.asin_price,
-            "Market Price": self.market_price,
-        }
+    _COLUMNS = _SQP_RECORD_COLUMNS
 
 
 @dataclass
@@ -111,13 +261,17 @@ class WeeklySnapshot:
     week_date: date
     records: list[SQPRecord] = field(default_factory=list)
 
+    def column(self, name: str) -> list[Any]:
+        """Get one field of every record, in record order."""
+        return list(map(attrgetter(name), self.records))
+
     def get_records_by_query(self) -> dict[str, SQPRecord]:
         """Get records indexed by search query."""
         return {r.search_query: r for r in self.records}
 
 
-@dataclass
-class CategorizedKeyword:
+@dataclass(slots=True)
+class CategorizedKeyword(SheetModel):
     """A keyword with its category and metrics."""
     search_query: str
     asin: str
@@ -134,22 +288,11 @@ class CategorizedKeyword:
     asin_price: float | None = None
     market_price: float | None = None
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for sheet output."""
-        return {
-            "Search Query": self.search_query,
-            "ASIN": self.asin,
-            "Category": self.category.value,
-            "Imp Share": self.impressions_share,
-            "Click Share": self.clicks_share,
-            "Purchase Share": self.purchases_share,
-            "Volume": self.search_volume,
-            "Recommended Action": self.action,
-        }
+    _COLUMNS = _CATEGORIZED_KEYWORD_COLUMNS
 
 
-@dataclass
-class TrendRecord:
+@dataclass(slots=True)
+class TrendRecord(SheetModel):
     """12-week trend data for a keyword."""
     search_query: str
     asin: str
@@ -157,22 +300,26 @@ class TrendRecord:
     trend_direction: TrendDirection = TrendDirection.STABLE
     growth_percent: float = 0.0
 
+    _COLUMNS = _TREND_RECORD_COLUMNS
+
+    @classmethod
+    def _getter(cls, header: str, column: Column | None) -> Callable[[Any], Any]:
+        """Headers that are not fixed columns are looked up as week labels."""
+        if column is None:
+            return lambda record: record.weekly_purchase_shares.get(header, "")
+        return SheetModel._getter(header, column)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for sheet output."""
-        result = {
-            "Search Query": self.search_query,
-            "ASIN": self.asin,
-            "Trend Direction": self.trend_direction.value,
-            "Growth %": self.growth_percent,
-        }
+        # slots=True rebuilds the class, which breaks zero-argument super()
+        result = SheetModel.to_dict(self)
         # Add weekly shares
-        for week, share in self.weekly_purchase_shares.items():
-            result[week] = share
+        result.update(self.weekly_purchase_shares)
         return result
 
 
-@dataclass
-class PriceFlag:
+@dataclass(slots=True)
+class PriceFlag(SheetModel):
     """Price competitiveness flag for a keyword."""
     search_query: str
     asin: str
@@ -183,22 +330,11 @@ class PriceFlag:
     impressions_share: float = 0.0
     purchases_share: float = 0.0
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for sheet output."""
-        return {
-            "Search Query": self.search_query,
-            "ASIN": self.asin,
-            "ASIN Price": self.asin_price,
-            "Market Price": self.market_price,
-            "Price Diff %": self.price_diff_percent,
-            "Severity": self.severity.value,
-            "Imp Share": self.impressions_share,
-            "Purchase Share": self.purchases_share,
-        }
+    _COLUMNS = _PRICE_FLAG_COLUMNS
 
 
-@dataclass
-class ASINSummary:
+@dataclass(slots=True)
+class ASINSummary(SheetModel):
     """Summary statistics for an ASIN."""
     asin: str
     product_name: str = ""
@@ -210,23 +346,11 @@ class ASINSummary:
     health_score: float = 0.0
     last_updated: date | None = None
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for sheet output."""
-        return {
-            "ASIN": self.asin,
-            "Product Name": self.product_name,
-            "Total Keywords": self.total_keywords,
-            "Bread & Butter": self.bread_butter_count,
-            "Opportunities": self.opportunities_count,
-            "Leaks": self.leaks_count,
-            "Price Flagged": self.price_flagged_count,
-            "Health Score": self.health_score,
-            "Last Updated": self.last_updated.isoformat() if self.last_updated else "",
-        }
+    _COLUMNS = _ASIN_SUMMARY_COLUMNS
 
 
-@dataclass
-class KeywordDiagnostic:
+@dataclass(slots=True)
+class KeywordDiagnostic(SheetModel):
     """Diagnostic analysis for a keyword."""
     search_query: str
     asin: str
@@ -239,24 +363,11 @@ class KeywordDiagnostic:
     purchases_share: float = 0.0
     recommended_fix: str = ""
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for sheet output."""
-        return {
-            "Search Query": self.search_query,
-            "ASIN": self.asin,
-            "Diagnostic": self.diagnostic_type.value,
-            "Rank Status": self.rank_status.value,
-            "Opportunity Score": self.opportunity_score,
-            "Volume": self.search_volume,
-            "Imp Share": self.impressions_share,
-            "Click Share": self.clicks_share,
-            "Purchase Share": self.purchases_share,
-            "Recommended Fix": self.recommended_fix,
-        }
+    _COLUMNS = _KEYWORD_DIAGNOSTIC_COLUMNS
 
 
-@dataclass
-class KeywordPlacement:
+@dataclass(slots=True)
+class KeywordPlacement(SheetModel):
     """Keyword placement recommendation."""
     search_query: str
     asin: str
@@ -266,14 +377,4 @@ class KeywordPlacement:
     clicks_share: float = 0.0
     reasoning: str = ""
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for sheet output."""
-        return {
-            "Search Query": self.search_query,
-            "ASIN": self.asin,
-            "Placement": self.placement.value,
-            "Priority": self.priority,
-            "Volume": self.search_volume,
-            "Click Share": self.clicks_share,
-            "Reasoning": self.reasoning,
-        }
+    _COLUMNS = _KEYWORD_PLACEMENT_COLUMNS
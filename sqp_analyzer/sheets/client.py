@@ -1,12 +1,33 @@
 """Google Sheets client for reading and writing SQP data."""
 
+import gzip
+import json
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Any
 from datetime import date
 
 import gspread
 from google.oauth2.service_account import Credentials
+from gspread.urls import SPREADSHEET_VALUES_BATCH_UPDATE_URL
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from ..config import SheetsConfig
+from ..models import (
+    ASINSummary,
+    CategorizedKeyword,
+    KeywordDiagnostic,
+    KeywordPlacement,
+    PriceFlag,
+    SheetModel,
+    SQPRecord,
+    TrendRecord,
+)
 
 
 SCOPES = [
@@ -15,6 +36,37 @@ SCOPES = [
 ]
 
 
+# "Active" column values that mark an ASIN as active
+_ACTIVE_VALUES = frozenset({"true", "yes", "1", "y", "active"})
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+@lru_cache(maxsize=None)
+def get_credentials(credentials_path: str) -> Credentials:
+    """Load service account credentials, once per file per process.
+
+    Every SheetsClient using the same file shares the credentials and the
+    access token they refresh.
+    """
+    return Credentials.from_service_account_file(credentials_path, scopes=SCOPES)
+
+
+def _to_rows(
+    model: type[SheetModel], records: Iterable[Any], headers: list[str]
+) -> list[list[Any]]:
+    """Build a tab's rows: the header row, then one row per record.
+
+    The headers are resolved to column getters once for the whole tab.
+    """
+    return [headers, *map(model.row_getter(headers), records)]
+
+
 class SheetsClient:
     """Client for Google Sheets operations."""
 
@@ -22,14 +74,15 @@ class SheetsClient:
         self.config = config
         self._client: gspread.Client | None = None
         self._spreadsheet: gspread.Spreadsheet | None = None
+        # Tab title -> sheet id, read once and kept up to date
+        self._tab_ids: dict[str, int] | None = None
+        # (tab name, rows) writes queued while inside batch()
+        self._pending: list[tuple[str, list[list[Any]]]] | None = None
 
     def _get_client(self) -> gspread.Client:
         """Get or create authenticated gspread client."""
         if self._client is None:
-            credentials = Credentials.from_service_account_file(
-                self.config.credentials_path,
-                scopes=SCOPES,
-            )
+            credentials = get_credentials(self.config.credentials_path)
             self._client = gspread.authorize(credentials)
         return self._client
 
@@ -40,6 +93,13 @@ class SheetsClient:
             self._spreadsheet = client.open_by_key(self.config.spreadsheet_id)
         return self._spreadsheet
 
+    def _get_tab_ids(self) -> dict[str, int]:
+        """Get the spreadsheet's sheet ids by tab title, cached after one read."""
+        if self._tab_ids is None:
+            spreadsheet = self._get_spreadsheet()
+            self._tab_ids = {ws.title: ws.id for ws in spreadsheet.worksheets()}
+        return self._tab_ids
+
     def read_asins(self) -> list[dict[str, Any]]:
         """Read parent ASINs from the master tab.
 
@@ -51,14 +111,16 @@ class SheetsClient:
         spreadsheet = self._get_spreadsheet()
         worksheet = spreadsheet.worksheet(self.config.master_tab_name)
         records = worksheet.get_all_records()
+        if not records:
+            return []
+
+        # Normalize column names once (case-insensitive, replace spaces with
+        # underscores); every record shares the header row's keys
+        normalized_keys = [k.lower().strip().replace(" ", "_") for k in records[0]]
 
         asins = []
         for record in records:
-            # Normalize column names (case-insensitive, replace spaces with underscores)
-            normalized = {
-                k.lower().strip().replace(" ", "_"): v
-                for k, v in record.items()
-            }
+            normalized = dict(zip(normalized_keys, record.values()))
 
             asin = normalized.get("asin") or normalized.get("parent_asin", "")
             if not asin:
@@ -70,9 +132,9 @@ class SheetsClient:
             active_col = normalized.get("active", "")
 
             if status:
-                active = str(status).upper() == "ACTIVE"
+                active = str(status).casefold() == "active"
             elif active_col:
-                active = str(active_col).upper() in ("TRUE", "YES", "1", "Y", "ACTIVE")
+                active = str(active_col).casefold() in _ACTIVE_VALUES
             else:
                 active = True  # Default to active if no status column
 
@@ -92,20 +154,88 @@ class SheetsClient:
         asins = self.read_asins()
         return [a["asin"] for a in asins if a.get("active", True)]
 
-    def _get_or_create_worksheet(
-        self, name: str, rows: int = 1000, cols: int = 20
-    ) -> gspread.Worksheet:
-        """Get existing worksheet or create new one."""
+    def write_tabs(self, tabs: list[tuple[str, list[list[Any]]]]) -> None:
+        """Replace the contents of several tabs with two requests in total.
+
+        The values are serialized directly (orjson when installed) and sent
+        gzip-compressed, which keeps large uploads fast.
+
+        Args:
+            tabs: (tab name, rows) pairs; rows include the header row
+        """
+        if not tabs:
+            return
+
+        # A tab written twice keeps only its last rows
+        tabs = list(dict(tabs).items())
         spreadsheet = self._get_spreadsheet()
+
+        # Create missing tabs and blank the values of existing ones in a single
+        # batch request; the tab ids are only fetched on the first write
+        tab_ids = self._get_tab_ids()
+        requests = []
+        for tab_name, rows in tabs:
+            sheet_id = tab_ids.get(tab_name)
+            if sheet_id is None:
+                requests.append({"addSheet": {"properties": {
+                    "title": tab_name,
+                    "gridProperties": {"rowCount": len(rows) + 100, "columnCount": 20},
+                }}})
+            else:
+                requests.append({"updateCells": {
+                    "range": {"sheetId": sheet_id},
+                    "fields": "userEnteredValue",
+                }})
+        response = spreadsheet.batch_update({"requests": requests})
+        for reply in response.get("replies", []):
+            if "addSheet" in reply:
+                properties = reply["addSheet"]["properties"]
+                tab_ids[properties["title"]] = properties["sheetId"]
+
+        body = _dumps({
+            "valueInputOption": "RAW",
+            "data": [
+                {"range": f"'{tab_name}'!A1", "values": rows}
+                for tab_name, rows in tabs
+            ],
+        })
+        spreadsheet.client.request(
+            "post",
+            SPREADSHEET_VALUES_BATCH_UPDATE_URL % spreadsheet.id,
+            data=gzip.compress(body, compresslevel=6),
+            headers={
+                "Content-Type": "application/json",
+                "Content-Encoding": "gzip",
+            },
+        )
+
+    @contextmanager
+    def batch(self) -> Iterator[list[tuple[str, list[list[Any]]]]]:
+        """Queue tab writes made inside the block and send them together.
+
+        Inside the block the write_* methods only build their rows; on exit
+        all queued tabs are written with write_tabs(), a handful of requests
+        in total instead of a clear and an update per tab. Yields the list
+        of queued (tab name, rows) pairs.
+        """
+        self._pending = pending = []
         try:
-            return spreadsheet.worksheet(name)
-        except gspread.WorksheetNotFound:
-            return spreadsheet.add_worksheet(title=name, rows=rows, cols=cols)
+            yield pending
+        finally:
+            self._pending = None
+        self.write_tabs(pending)
+
+    def _write_tab(self, tab_name: str, rows: list[list[Any]]) -> None:
+        """Replace a tab's contents with rows, or queue it inside batch()."""
+        if self._pending is not None:
+            self._pending.append((tab_name, rows))
+        else:
+            self.write_tabs([(tab_name, rows)])
 
     def write_weekly_data(
         self,
         week_date: date,
-        data: list[dict[str, Any]],
+        data: Iterable[SQPRecord],
         headers: list[str] | None = None,
     ) -> None:
         """Write weekly SQP data to a tab.
@@ -133,45 +263,18 @@ class SheetsClient:
                 "Market Price",
             ]
 
-        worksheet = self._get_or_create_worksheet(tab_name, rows=len(data) + 100)
-
-        # Clear existing content and write new
-        worksheet.clear()
-
-        if not data:
-            worksheet.update("A1", [headers])
-            return
-
-        # Build rows
-        rows = [headers]
-        for record in data:
-            row = [record.get(h, "") for h in headers]
-            rows.append(row)
-
-        worksheet.update("A1", rows)
+        self._write_tab(tab_name, _to_rows(SQPRecord, data, headers))
 
     def write_categorized_keywords(
         self,
         tab_name: str,
-        keywords: list[dict[str, Any]],
+        keywords: Iterable[CategorizedKeyword],
         headers: list[str],
     ) -> None:
         """Write categorized keywords to a specific tab."""
-        worksheet = self._get_or_create_worksheet(tab_name, rows=len(keywords) + 100)
-        worksheet.clear()
-
-        if not keywords:
-            worksheet.update("A1", [headers])
-            return
-
-        rows = [headers]
-        for kw in keywords:
-            row = [kw.get(h, "") for h in headers]
-            rows.append(row)
-
-        worksheet.update("A1", rows)
+        self._write_tab(tab_name, _to_rows(CategorizedKeyword, keywords, headers))
 
-    def write_summary(self, summary_data: list[dict[str, Any]]) -> None:
+    def write_summary(self, summary_data: Iterable[ASINSummary]) -> None:
         """Write summary dashboard to SQP-Summary tab."""
         headers = [
             "ASIN",
@@ -185,16 +288,9 @@ class SheetsClient:
             "Last Updated",
         ]
 
-        worksheet = self._get_or_create_worksheet("SQP-Summary")
-        worksheet.clear()
+        self._write_tab("SQP-Summary", _to_rows(ASINSummary, summary_data, headers))
 
-        rows = [headers]
-        for record in summary_data:
-            rows.append([record.get(h, "") for h in headers])
-
-        worksheet.update("A1", rows)
-
-    def write_trends(self, trends: list[dict[str, Any]]) -> None:
+    def write_trends(self, trends: list[TrendRecord]) -> None:
         """Write 12-week trend data to SQP-Trends tab."""
         # Dynamic headers based on weeks available
         base_headers = ["Search Query", "ASIN"]
@@ -202,23 +298,15 @@ class SheetsClient:
 
         if trends:
             # Extract week columns from first record
-            sample = trends[0]
+            sample = trends[0].weekly_purchase_shares
             week_headers = [k for k in sample.keys() if k.startswith("Week ")]
             week_headers.sort()
 
         headers = base_headers + week_headers + ["Trend Direction", "Growth %"]
 
-        worksheet = self._get_or_create_worksheet("SQP-Trends", rows=len(trends) + 100)
-        worksheet.clear()
-
-        rows = [headers]
-        for record in trends:
-            row = [record.get(h, "") for h in headers]
-            rows.append(row)
-
-        worksheet.update("A1", rows)
+        self._write_tab("SQP-Trends", _to_rows(TrendRecord, trends, headers))
 
-    def write_price_flags(self, flags: list[dict[str, Any]]) -> None:
+    def write_price_flags(self, flags: Iterable[PriceFlag]) -> None:
         """Write price competitiveness flags to SQP-PriceFlags tab."""
         headers = [
             "Search Query",
@@ -231,16 +319,9 @@ class SheetsClient:
             "Purchase Share",
         ]
 
-        worksheet = self._get_or_create_worksheet("SQP-PriceFlags")
-        worksheet.clear()
+        self._write_tab("SQP-PriceFlags", _to_rows(PriceFlag, flags, headers))
 
-        rows = [headers]
-        for record in flags:
-            rows.append([record.get(h, "") for h in headers])
-
-        worksheet.update("A1", rows)
-
-    def write_diagnostics(self, diagnostics: list[dict[str, Any]]) -> None:
+    def write_diagnostics(self, diagnostics: Iterable[KeywordDiagnostic]) -> None:
         """Write keyword diagnostics to SQP-Diagnostics tab."""
         headers = [
             "Search Query",
@@ -255,18 +336,10 @@ class SheetsClient:
             "Recommended Fix",
         ]
 
-        worksheet = self._get_or_create_worksheet(
-            "SQP-Diagnostics", rows=len(diagnostics) + 100
-        )
-        worksheet.clear()
-
-        rows = [headers]
-        for record in diagnostics:
-            rows.append([record.get(h, "") for h in headers])
-
-        worksheet.update("A1", rows)
+        rows = _to_rows(KeywordDiagnostic, diagnostics, headers)
+        self._write_tab("SQP-Diagnostics", rows)
 
-    def write_placements(self, placements: list[dict[str, Any]]) -> None:
+    def write_placements(self, placements: Iterable[KeywordPlacement]) -> None:
         """Write keyword placement recommendations to SQP-Placements tab."""
         headers = [
             "Search Query",
@@ -278,21 +351,14 @@ class SheetsClient:
             "Reasoning",
         ]
 
-        worksheet = self._get_or_create_worksheet(
-            "SQP-Placements", rows=len(placements) + 100
-        )
-        worksheet.clear()
-
-        rows = [headers]
-        for record in placements:
-            rows.append([record.get(h, "") for h in headers])
+        rows = _to_rows(KeywordPlacement, placements, headers)
+        self._write_tab("SQP-Placements", rows)
 
-        worksheet.update("A1", rows)
-
-    def write_opportunity_ranking(self, opportunities: list[dict[str, Any]]) -> None:
+    def write_opportunity_ranking(
+        self, opportunities: Iterable[KeywordDiagnostic]
+    ) -> None:
         """Write top opportunities to SQP-TopOpportunities tab."""
-        headers = [
-            "Rank",
+        columns = [
             "Search Query",
             "ASIN",
             "Opportunity Score",
@@ -301,33 +367,26 @@ class SheetsClient:
             "Diagnostic",
             "Recommended Fix",
         ]
+        headers = ["Rank", *columns]
 
-        worksheet = self._get_or_create_worksheet(
-            "SQP-TopOpportunities", rows=len(opportunities) + 100
-        )
-        worksheet.clear()
-
-        rows = [headers]
-        for i, record in enumerate(opportunities, 1):
-            row = [
-                i,  # Rank
-                record.get("Search Query", ""),
-                record.get("ASIN", ""),
-                record.get("Opportunity Score", ""),
-                record.get("Volume", ""),
-                record.get("Imp Share", ""),
-                record.get("Diagnostic", ""),
-                record.get("Recommended Fix", ""),
-            ]
-            rows.append(row)
+        get_row = KeywordDiagnostic.row_getter(columns)
+        rows = [
+            headers,
+            *([i, *get_row(record)] for i, record in enumerate(opportunities, 1)),
+        ]
 
-        worksheet.update("A1", rows)
+        self._write_tab("SQP-TopOpportunities", rows)
 
     def test_connection(self) -> bool:
-        """Test connection to Google Sheets."""
+        """Test connection to Google Sheets.
+
+        Fetches only the spreadsheet id rather than opening the spreadsheet,
+        which would download the metadata of every tab.
+        """
         try:
-            spreadsheet = self._get_spreadsheet()
-            _ = spreadsheet.title
+            self._get_client().http_client.fetch_sheet_metadata(
+                self.config.spreadsheet_id, params={"fields": "spreadsheetId"}
+            )
             return True
         except Exception:
             return False
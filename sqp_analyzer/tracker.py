@@ -4,6 +4,7 @@ import csv
 import io
 import re
 from datetime import date
+from operator import itemgetter
 from pathlib import Path
 
 import gspread
@@ -150,7 +151,7 @@ def track_weekly(csv_path: str, spreadsheet_id: str, credentials_path: str = "go
 
     # Write updated data
     ws.clear()
-    ws.update(values=new_rows, range_name="A1")
+    ws.update(values=new_rows, range_name="A1", value_input_option="RAW")
 
     # Re-apply checkbox validation to "In Title" column if it exists
     if "In Title" in new_headers:
@@ -227,7 +228,7 @@ def reset_watchlist(csv_path: str, spreadsheet_id: str, credentials_path: str =
             })
 
     # Sort by Amazon's Score (lower = better)
-    keywords.sort(key=lambda x: x["score"])
+    keywords.sort(key=itemgetter("score"))
     top_10 = keywords[:10]
 
     if not top_10:
@@ -271,7 +272,7 @@ def reset_watchlist(csv_path: str, spreadsheet_id: str, credentials_path: str =
             ""
         ])
 
-    ws.update(values=rows, range_name="A1")
+    ws.update(values=rows, range_name="A1", value_input_option="RAW")
 
     # Add checkbox data validation to "In Title" column (C2:C11)
     sheet_id = ws.id